@@ -4,38 +4,314 @@ Simple REST API for remote monitoring of the trading bot.
 Provides read-only access to bot status, performance, and trade data.
 """
 
+import math
 import sys
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+    import json
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from flask import Flask, jsonify, request
-from src.database import DatabaseManager, FillRecord, EventRecord, SymbolState, OrderRecord
+from sqlalchemy import literal_column
+from flask import Flask, Response, request, stream_with_context
+from werkzeug.exceptions import BadRequest
+from src.database import (
+    ACTIVE_ORDER_STATUSES, DatabaseManager, FillRecord, EventRecord, SymbolState, OrderRecord,
+)
 from src.performance import PerformanceTracker
 
 app = Flask(__name__)
 
+# Compress larger JSON bodies (fills/events/performance) when the client accepts it
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+if Compress is not None:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    # /fills, /orders and /events are streamed; newer Flask-Compress
+    # releases leave gzip out of the streaming algorithms by default
+    app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    Compress(app)
+
 # Database connection
 DB_PATH = "sqlite:///bot.db"
 db = DatabaseManager(DB_PATH)
 tracker = PerformanceTracker(db)
 
+# Columns serialized by the list endpoints; selecting them directly returns
+# lightweight rows instead of hydrating full ORM instances
+FILL_COLUMNS = (
+    FillRecord.ts, FillRecord.symbol, FillRecord.side, FillRecord.qty,
+    FillRecord.price, FillRecord.order_id, FillRecord.exec_id,
+)
+ORDER_COLUMNS = (
+    OrderRecord.order_id, OrderRecord.symbol, OrderRecord.side, OrderRecord.order_type,
+    OrderRecord.qty, OrderRecord.status, OrderRecord.stop_price, OrderRecord.limit_price,
+    OrderRecord.trailing_pct, OrderRecord.parent_id, OrderRecord.created_at,
+)
+EVENT_COLUMNS = (
+    EventRecord.ts, EventRecord.event_type, EventRecord.symbol, EventRecord.payload_json,
+)
+
+# Short-lived cache for the expensive aggregate endpoints. The bot writes to
+# the database from a separate process, so entries simply expire after the TTL.
+CACHE_TTL_SECONDS = 3.0
+_cache = {}
+_cache_lock = threading.Lock()
+
+# Database liveness is probed in the background so /health never touches the DB
+HEALTH_CHECK_INTERVAL_SECONDS = 10.0
+_health = {"healthy": None, "checked_at": None, "error": None}
+_health_lock = threading.Lock()
+_health_thread = None
+
+# /stream re-checks for changes this often, and sends a keep-alive comment
+# when nothing has been pushed for a while so idle proxies keep the socket
+STREAM_POLL_SECONDS = 2.0
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+# Each /stream subscriber holds a server worker thread (8 by default), so
+# only a few may be connected at once, and each stream ends after a while
+# (clients reconnect) so stale connections can't hold threads forever
+STREAM_MAX_SUBSCRIBERS = 2
+STREAM_MAX_SECONDS = 300.0
+STREAM_RETRY_MS = 2000
+_stream_slots = threading.BoundedSemaphore(STREAM_MAX_SUBSCRIBERS)
+
+
+def _json_default(obj):
+    """Encode values the stdlib JSON encoder doesn't handle natively."""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj):
+    """Serialize obj to JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_json_default).encode()
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response.
+
+    Uses orjson when installed, which serializes datetimes natively to
+    ISO-8601 and is considerably faster than flask.jsonify on record-heavy
+    payloads.
+    """
+    return Response(dumps(payload), status=status, mimetype='application/json')
+
+
+def json_stream(header, key, rows, to_record):
+    """
+    Build a streamed JSON response of the form {**header, key: [...], "count": N}.
+
+    Records are encoded and sent one at a time as rows are read from the
+    cursor, so a full list of record dicts is never held in memory. The
+    request context (and with it the request's session) stays open until
+    streaming finishes.
+
+    Args:
+        header: Dict of top-level fields written before the list
+        key: Name of the list field
+        rows: Iterable of ORM rows
+        to_record: Callable converting a row to a JSON-serializable dict,
+            or directly to encoded JSON bytes
+    """
+    return Response(
+        stream_with_context(_json_list_chunks(header, key, rows, to_record)),
+        mimetype='application/json',
+    )
+
+
+def _json_list_chunks(header, key, rows, to_record):
+    """
+    Yield the encoded chunks of {**header, key: [...], "count": N} (see json_stream).
+
+    The 200 status has already gone out by the time rows are read, so a
+    failure while streaming is logged and closes the document with an
+    "error" field after the records sent so far, keeping the body valid JSON.
+    """
+    yield dumps(header)[:-1] + b',"' + key.encode() + b'":['
+    count = 0
+    try:
+        for row in rows:
+            record = to_record(row)
+            if not isinstance(record, bytes):
+                record = dumps(record)
+            yield b',' + record if count else record
+            count += 1
+    except Exception as e:
+        app.logger.exception("Streaming %s failed after %d records", key, count)
+        yield b'],"count":' + str(count).encode() + b',"error":' + dumps(str(e)) + b'}'
+        return
+    yield b'],"count":' + str(count).encode() + b'}'
+
+
+def bounded_int_arg(name, default, cap):
+    """
+    Parse an integer query parameter, clamped to [1, cap].
+    
+    Raises:
+        BadRequest: If the parameter is present but not an integer
+    """
+    raw = request.args.get(name)
+    if raw is None or raw == '':
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise BadRequest(f"'{name}' must be an integer, got {raw!r}")
+    return max(1, min(value, cap))
+
+
+def get_session():
+    """Get this thread's request-scoped session (removed on teardown)."""
+    return db.scoped_session()
+
+
+@app.teardown_appcontext
+def remove_session(exc=None):
+    """Return the request's session and connection to the pool."""
+    db.scoped_session.remove()
+
+
+@app.errorhandler(BadRequest)
+def bad_request(e):
+    """Return client errors as JSON like the rest of the API."""
+    return json_response({"error": e.description}, status=400)
+
+
+def cached(key, builder):
+    """
+    Return the cached payload for key, calling builder() to refresh it.
+    
+    Args:
+        key: Hashable cache key (include any query parameters)
+        builder: Zero-argument callable that builds the payload
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+    
+    payload = builder()
+    with _cache_lock:
+        _cache[key] = (now + CACHE_TTL_SECONDS, payload)
+    return payload
+
+
+class RecentFillsBuffer:
+    """
+    In-memory buffer of the newest fills (SQLite only), topped up incrementally.
+    
+    Fills are append-only, so after the initial load each refresh only reads
+    rows whose rowid is above the last one seen - an indexed range read that
+    is usually empty. Merging those into the buffer and keeping the newest
+    `capacity` by timestamp keeps it identical to ORDER BY ts DESC LIMIT
+    capacity, so /fills can be answered from memory.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._fills = []
+        self._high_rowid = None
+    
+    def clear(self):
+        """Forget buffered fills; the next read reloads them."""
+        with self._lock:
+            self._fills = []
+            self._high_rowid = None
+    
+    def newest(self, session, limit: int):
+        """Get the newest `limit` fills (limit must not exceed capacity)."""
+        rowid = literal_column("rowid")
+        with self._lock:
+            high_rowid = db.count_fills(session)  # MAX(rowid) on SQLite
+            if self._high_rowid is None or high_rowid < self._high_rowid:
+                # First use (or the table was reset): load the newest fills
+                self._fills = (
+                    session.query(*FILL_COLUMNS)
+                    .filter(rowid <= high_rowid)
+                    .order_by(FillRecord.ts.desc())
+                    .limit(self.capacity)
+                    .all()
+                )
+            elif high_rowid > self._high_rowid:
+                new_fills = (
+                    session.query(*FILL_COLUMNS)
+                    .filter(rowid > self._high_rowid, rowid <= high_rowid)
+                    .all()
+                )
+                merged = self._fills + new_fills
+                merged.sort(key=lambda fill: fill.ts or datetime.min, reverse=True)
+                self._fills = merged[:self.capacity]
+            self._high_rowid = high_rowid
+            return self._fills[:limit]
+
+
+# Sized to the /fills limit cap, so every request can be served from memory
+recent_fills = RecentFillsBuffer(capacity=200)
+
+
+def clear_cache():
+    """Drop all cached payloads and buffered fills."""
+    with _cache_lock:
+        _cache.clear()
+    recent_fills.clear()
+
+
+def check_database_health():
+    """Run the database liveness query and record the result for /health."""
+    try:
+        with db.get_session() as session:
+            session.query(EventRecord.id).first()
+        healthy, error = True, None
+    except Exception as e:
+        healthy, error = False, str(e)
+    
+    with _health_lock:
+        _health.update(healthy=healthy, checked_at=datetime.utcnow(), error=error)
 
-def format_timestamp(ts):
-    """Format timestamp for JSON."""
-    if ts is None:
-        return None
-    if isinstance(ts, str):
-        return ts
-    return ts.strftime("%Y-%m-%d %H:%M:%S")
+
+def _health_probe_loop():
+    """Re-check database health at a fixed interval."""
+    while True:
+        time.sleep(HEALTH_CHECK_INTERVAL_SECONDS)
+        check_database_health()
+
+
+def _ensure_health_probe():
+    """Start the background health probe on first use."""
+    global _health_thread
+    with _health_lock:
+        if _health_thread is not None:
+            return
+        _health_thread = threading.Thread(
+            target=_health_probe_loop, name="health-probe", daemon=True
+        )
+        _health_thread.start()
 
 
 @app.route('/')
 def index():
     """API documentation."""
-    return jsonify({
+    return json_response({
         "name": "Crazy Trade Bot API",
         "version": "1.0",
         "description": "Read-only monitoring API for the trading bot",
@@ -53,6 +329,8 @@ def index():
             "/events?limit=N": "Recent N events",
             "/daily": "Daily P&L (default 10 days)",
             "/daily?days=N": "Daily P&L for N days",
+            "/snapshot?include=status,orders,fills,performance,daily": "Several endpoints in one response",
+            "/stream": "Server-sent events: status/performance changes and new fills",
             "/reset": "Instructions to reset paper account (POST)",
             "/admin/close_all": "Instructions to close all positions (POST)"
         }
@@ -61,30 +339,35 @@ def index():
 
 @app.route('/health')
 def health():
-    """Health check endpoint."""
-    try:
-        with db.get_session() as session:
-            # Try a simple query to verify DB connection
-            session.query(EventRecord).first()
-        return jsonify({
+    """Health check endpoint (served from the background probe's last result)."""
+    _ensure_health_probe()
+    if _health["checked_at"] is None:
+        check_database_health()
+    
+    with _health_lock:
+        healthy, checked_at, error = _health["healthy"], _health["checked_at"], _health["error"]
+    
+    if healthy:
+        return json_response({
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
+            "last_check": checked_at,
             "database": "connected"
         })
-    except Exception as e:
-        return jsonify({
-            "status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e)
-        }), 500
+    return json_response({
+        "status": "unhealthy",
+        "timestamp": datetime.utcnow(),
+        "last_check": checked_at,
+        "error": error
+    }, status=500)
 
 
 @app.route('/v1/api/tickle', methods=['POST'])
 def tickle():
     """Keep-alive endpoint for external monitoring systems."""
-    return jsonify({
+    return json_response({
         "status": "ok",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.utcnow()
     })
 
 
@@ -92,259 +375,444 @@ def tickle():
 def status():
     """Get bot status and symbol states."""
     try:
-        with db.get_session() as session:
-            # Symbol states
-            states = session.query(SymbolState).all()
-            stock_states = []
-            crypto_states = []
-            for state in states:
-                in_cooldown = state.cooldown_until_ts and state.cooldown_until_ts > datetime.utcnow()
-                state_data = {
-                    "symbol": state.symbol,
-                    "in_cooldown": in_cooldown,
-                    "cooldown_until": format_timestamp(state.cooldown_until_ts),
-                    "last_parent_id": state.last_parent_id,
-                    "last_trail_id": state.last_trail_id
-                }
-                # Separate stocks from crypto
-                if '/' in state.symbol:
-                    crypto_states.append(state_data)
-                else:
-                    stock_states.append(state_data)
-            
-            # Active orders count
-            active_orders = db.get_active_orders(session)
-            active_count = len(active_orders)
-            
-            # Total fills
-            total_fills = session.query(FillRecord).count()
-            
-            # Last event
-            last_event = session.query(EventRecord).order_by(EventRecord.ts.desc()).first()
-            
-            # Check if bot started recently
-            bot_started = session.query(EventRecord).filter(
-                EventRecord.event_type == 'bot_started'
-            ).order_by(EventRecord.ts.desc()).first()
-            
-            return jsonify({
-                "timestamp": datetime.utcnow().isoformat(),
-                "symbols": stock_states + crypto_states,  # All symbols
-                "stock_symbols": stock_states,
-                "crypto_symbols": crypto_states,
-                "active_orders": active_count,
-                "total_fills": total_fills,
-                "last_event": {
-                    "type": last_event.event_type if last_event else None,
-                    "symbol": last_event.symbol if last_event else None,
-                    "timestamp": format_timestamp(last_event.ts) if last_event else None
-                },
-                "bot_started": format_timestamp(bot_started.ts) if bot_started else None
-            })
+        return json_response(cached(('status',), _build_status))
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, status=500)
+
+
+def _build_status():
+    """Build the /status payload."""
+    now = datetime.utcnow()
+    with get_session() as session:
+        # Symbol states
+        states = session.query(SymbolState).all()
+        stock_states = []
+        crypto_states = []
+        for state in states:
+            in_cooldown = state.cooldown_until_ts and state.cooldown_until_ts > now
+            state_data = {
+                "symbol": state.symbol,
+                "in_cooldown": in_cooldown,
+                "cooldown_until": state.cooldown_until_ts,
+                "last_parent_id": state.last_parent_id,
+                "last_trail_id": state.last_trail_id
+            }
+            # Separate stocks from crypto
+            if '/' in state.symbol:
+                crypto_states.append(state_data)
+            else:
+                stock_states.append(state_data)
+        
+        # Counters and latest events in one round-trip
+        summary = db.get_status_summary(session)
+        
+        return {
+            "timestamp": now,
+            "symbols": stock_states + crypto_states,  # All symbols
+            "stock_symbols": stock_states,
+            "crypto_symbols": crypto_states,
+            "active_orders": summary['active_orders'],
+            "total_fills": summary['total_fills'],
+            "last_event": {
+                "type": summary['last_event_type'],
+                "symbol": summary['last_event_symbol'],
+                "timestamp": summary['last_event_ts']
+            },
+            "bot_started": summary['bot_started_ts']
+        }
 
 
 @app.route('/performance')
 def performance():
     """Get performance metrics."""
     try:
-        with db.get_session() as session:
-            # Get overall performance
-            closed_trades = tracker.calculate_closed_trades(session)
-            
-            if not closed_trades:
-                return jsonify({
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "message": "No closed trades yet",
-                    "total_trades": 0
-                })
-            
-            # Calculate metrics
-            winning_trades = [t for t in closed_trades if t['pnl'] > 0]
-            losing_trades = [t for t in closed_trades if t['pnl'] < 0]
-            
-            total_pnl = sum(t['pnl'] for t in closed_trades)
-            win_rate = len(winning_trades) / len(closed_trades) * 100 if closed_trades else 0
-            
-            gross_profit = sum(t['pnl'] for t in winning_trades)
-            gross_loss = abs(sum(t['pnl'] for t in losing_trades))
-            profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
-            
-            # Per-symbol breakdown
-            symbol_stats = {}
-            for trade in closed_trades:
-                symbol = trade['symbol']
-                if symbol not in symbol_stats:
-                    symbol_stats[symbol] = {
-                        'trades': 0,
-                        'pnl': 0,
-                        'wins': 0,
-                        'losses': 0
-                    }
-                symbol_stats[symbol]['trades'] += 1
-                symbol_stats[symbol]['pnl'] += trade['pnl']
-                if trade['pnl'] > 0:
-                    symbol_stats[symbol]['wins'] += 1
-                else:
-                    symbol_stats[symbol]['losses'] += 1
-            
-            return jsonify({
-                "timestamp": datetime.utcnow().isoformat(),
-                "overall": {
-                    "total_trades": len(closed_trades),
-                    "winning_trades": len(winning_trades),
-                    "losing_trades": len(losing_trades),
-                    "win_rate_pct": round(win_rate, 2),
-                    "total_pnl": round(total_pnl, 2),
-                    "gross_profit": round(gross_profit, 2),
-                    "gross_loss": round(gross_loss, 2),
-                    "profit_factor": round(profit_factor, 2),
-                    "avg_win": round(gross_profit / len(winning_trades), 2) if winning_trades else 0,
-                    "avg_loss": round(gross_loss / len(losing_trades), 2) if losing_trades else 0
-                },
-                "by_symbol": symbol_stats
-            })
+        return json_response(cached(('performance',), _build_performance))
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, status=500)
+
+
+def _build_performance():
+    """Build the /performance payload."""
+    with get_session() as session:
+        # Get overall performance
+        closed_trades = tracker.calculate_closed_trades(session)
+        
+        if not closed_trades:
+            return {
+                "timestamp": datetime.utcnow(),
+                "message": "No closed trades yet",
+                "total_trades": 0
+            }
+        
+        total_trades = len(closed_trades)
+        num_wins, num_losses, gross_profit, gross_loss, symbol_stats = (
+            _aggregate_trades(closed_trades)
+        )
+        
+        total_pnl = gross_profit - gross_loss
+        win_rate = num_wins / total_trades * 100
+        profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
+        
+        return {
+            "timestamp": datetime.utcnow(),
+            "overall": {
+                "total_trades": total_trades,
+                "winning_trades": num_wins,
+                "losing_trades": num_losses,
+                "win_rate_pct": round(win_rate, 2),
+                "total_pnl": round(total_pnl, 2),
+                "gross_profit": round(gross_profit, 2),
+                "gross_loss": round(gross_loss, 2),
+                "profit_factor": round(profit_factor, 2),
+                "avg_win": round(gross_profit / num_wins, 2) if num_wins else 0,
+                "avg_loss": round(gross_loss / num_losses, 2) if num_losses else 0
+            },
+            "by_symbol": symbol_stats
+        }
+
+
+def _aggregate_trades(closed_trades):
+    """
+    Aggregate closed trades into overall and per-symbol win/loss metrics.
+    
+    Returns:
+        Tuple of (num_wins, num_losses, gross_profit, gross_loss, symbol_stats)
+    """
+    # Overall and per-symbol metrics in a single pass
+    num_wins = num_losses = 0
+    gross_profit = gross_loss = 0.0
+    symbol_stats = {}
+    for trade in closed_trades:
+        pnl = trade['pnl']
+        stats = symbol_stats.get(trade['symbol'])
+        if stats is None:
+            stats = symbol_stats[trade['symbol']] = {
+                'trades': 0,
+                'pnl': 0,
+                'wins': 0,
+                'losses': 0
+            }
+        stats['trades'] += 1
+        stats['pnl'] += pnl
+        if pnl > 0:
+            num_wins += 1
+            gross_profit += pnl
+            stats['wins'] += 1
+        else:
+            stats['losses'] += 1
+            if pnl < 0:
+                num_losses += 1
+                gross_loss -= pnl
+    
+    return num_wins, num_losses, gross_profit, gross_loss, symbol_stats
 
 
 @app.route('/fills')
 def fills():
     """Get recent fills."""
+    limit = bounded_int_arg('limit', default=20, cap=200)
     try:
-        limit = request.args.get('limit', default=20, type=int)
-        limit = min(limit, 200)  # Cap at 200
-        
-        with db.get_session() as session:
-            recent_fills = (
-                session.query(FillRecord)
-                .order_by(FillRecord.ts.desc())
-                .limit(limit)
-                .all()
-            )
-            
-            fills_data = [{
-                "timestamp": format_timestamp(fill.ts),
-                "symbol": fill.symbol,
-                "side": fill.side,
-                "quantity": fill.qty,
-                "price": round(fill.price, 2),
-                "order_id": fill.order_id,
-                "exec_id": fill.exec_id
-            } for fill in recent_fills]
-            
-            return jsonify({
-                "timestamp": datetime.utcnow().isoformat(),
-                "count": len(fills_data),
-                "fills": fills_data
-            })
+        return json_stream(
+            {"timestamp": datetime.utcnow()},
+            "fills",
+            _recent_fill_rows(get_session(), limit),
+            _fill_record,
+        )
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, status=500)
+
+
+def _recent_fill_rows(session, limit):
+    """Get the newest `limit` fill rows, from the in-memory buffer when possible."""
+    if db.engine.dialect.name == "sqlite" and limit <= recent_fills.capacity:
+        return recent_fills.newest(session, limit)
+    return iter(
+        session.query(*FILL_COLUMNS)
+        .order_by(FillRecord.ts.desc())
+        .limit(limit)
+        .yield_per(64)
+    )
+
+
+# Precompiled fill layout: only the values are encoded per row, so no
+# per-row dict is built and the constant keys are never re-encoded. The
+# price is formatted straight to two decimals instead of round() + encode.
+_FILL_TEMPLATE = (
+    b'{"timestamp":%b,"symbol":%b,"side":%b,"quantity":%b,'
+    b'"price":%b,"order_id":%b,"exec_id":%b}'
+)
+
+
+def _fill_record(fill):
+    """Serialize a fill row to JSON bytes."""
+    price = fill.price
+    return _FILL_TEMPLATE % (
+        dumps(fill.ts),
+        dumps(fill.symbol),
+        dumps(fill.side),
+        dumps(fill.qty),
+        # nan/inf aren't valid JSON; encode them as null like orjson does
+        b'%.2f' % price if math.isfinite(price) else b'null',
+        dumps(fill.order_id),
+        dumps(fill.exec_id),
+    )
 
 
 @app.route('/orders')
 def orders():
     """Get orders (active by default, or all with limit)."""
+    limit = bounded_int_arg('limit', default=200, cap=200)
+    status_filter = request.args.get('status', default='active', type=str)
     try:
-        limit = request.args.get('limit', default=None, type=int)
-        status_filter = request.args.get('status', default='active', type=str)
-        
-        if limit:
-            limit = min(limit, 200)  # Cap at 200
-        
-        with db.get_session() as session:
-            if status_filter == 'active':
-                # Only active orders (default behavior)
-                orders_list = db.get_active_orders(session)
-            elif status_filter == 'all':
-                # All orders with limit
-                query = session.query(OrderRecord).order_by(OrderRecord.created_at.desc())
-                if limit:
-                    query = query.limit(limit)
-                orders_list = query.all()
-            else:
-                # Filter by specific status
-                query = session.query(OrderRecord).filter(
-                    OrderRecord.status == status_filter
-                ).order_by(OrderRecord.created_at.desc())
-                if limit:
-                    query = query.limit(limit)
-                orders_list = query.all()
-            
-            orders_data = [{
-                "order_id": order.order_id,
-                "symbol": order.symbol,
-                "side": order.side,
-                "order_type": order.order_type,
-                "quantity": order.qty,
-                "status": order.status,
-                "stop_price": order.stop_price,
-                "limit_price": order.limit_price,
-                "trailing_pct": order.trailing_pct,
-                "parent_id": order.parent_id,
-                "created_at": format_timestamp(order.created_at)
-            } for order in orders_list]
-            
-            return jsonify({
-                "timestamp": datetime.utcnow().isoformat(),
-                "count": len(orders_data),
-                "status_filter": status_filter,
-                "orders": orders_data
-            })
+        return json_stream(
+            {"timestamp": datetime.utcnow(), "status_filter": status_filter},
+            "orders",
+            iter(_orders_query(get_session(), status_filter, limit).yield_per(64)),
+            _order_record,
+        )
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, status=500)
+
+
+def _orders_query(session, status_filter, limit):
+    """Build the /orders query for a status filter ('active', 'all' or a status)."""
+    if status_filter == 'active':
+        # Only active orders (default behavior)
+        return session.query(*ORDER_COLUMNS).filter(
+            OrderRecord.status.in_(ACTIVE_ORDER_STATUSES)
+        )
+    if status_filter == 'all':
+        # All orders with limit
+        return (
+            session.query(*ORDER_COLUMNS)
+            .order_by(OrderRecord.created_at.desc())
+            .limit(limit)
+        )
+    # Filter by specific status
+    return (
+        session.query(*ORDER_COLUMNS)
+        .filter(OrderRecord.status == status_filter)
+        .order_by(OrderRecord.created_at.desc())
+        .limit(limit)
+    )
+
+
+def _order_record(order):
+    """Serialize an order row."""
+    return {
+        "order_id": order.order_id,
+        "symbol": order.symbol,
+        "side": order.side,
+        "order_type": order.order_type,
+        "quantity": order.qty,
+        "status": order.status,
+        "stop_price": order.stop_price,
+        "limit_price": order.limit_price,
+        "trailing_pct": order.trailing_pct,
+        "parent_id": order.parent_id,
+        "created_at": order.created_at
+    }
 
 
 @app.route('/events')
 def events():
     """Get recent events."""
+    limit = bounded_int_arg('limit', default=20, cap=200)
     try:
-        limit = request.args.get('limit', default=20, type=int)
-        limit = min(limit, 200)  # Cap at 200
+        session = get_session()
+        recent_events = iter(
+            session.query(*EVENT_COLUMNS)
+            .order_by(EventRecord.ts.desc())
+            .limit(limit)
+            .yield_per(64)
+        )
         
-        with db.get_session() as session:
-            recent_events = (
-                session.query(EventRecord)
-                .order_by(EventRecord.ts.desc())
-                .limit(limit)
-                .all()
-            )
-            
-            events_data = [{
-                "timestamp": format_timestamp(event.ts),
-                "event_type": event.event_type,
-                "symbol": event.symbol,
-                "payload": event.payload_json
-            } for event in recent_events]
-            
-            return jsonify({
-                "timestamp": datetime.utcnow().isoformat(),
-                "count": len(events_data),
-                "events": events_data
-            })
+        return json_stream(
+            {"timestamp": datetime.utcnow()},
+            "events",
+            recent_events,
+            _event_record,
+        )
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, status=500)
+
+
+def _event_record(event):
+    """Serialize an event row."""
+    return {
+        "timestamp": event.ts,
+        "event_type": event.event_type,
+        "symbol": event.symbol,
+        "payload": event.payload_json
+    }
 
 
 @app.route('/daily')
 def daily():
     """Get daily P&L."""
+    days = bounded_int_arg('days', default=10, cap=90)
     try:
-        days = request.args.get('days', default=10, type=int)
-        days = min(days, 90)  # Cap at 90 days
+        return json_response(cached(('daily', days), lambda: _build_daily(days)))
+    except Exception as e:
+        return json_response({"error": str(e)}, status=500)
+
+
+def _build_daily(days):
+    """Build the /daily payload."""
+    with get_session() as session:
+        daily_pnl = tracker.get_daily_pnl(session, days=days)
         
-        with db.get_session() as session:
-            daily_pnl = tracker.get_daily_pnl(session, days=days)
-            
-            return jsonify({
-                "timestamp": datetime.utcnow().isoformat(),
-                "days": days,
-                "count": len(daily_pnl),
-                "daily_pnl": daily_pnl
-            })
+        return {
+            "timestamp": datetime.utcnow(),
+            "days": days,
+            "count": len(daily_pnl),
+            "daily_pnl": daily_pnl
+        }
+
+
+SNAPSHOT_SECTIONS = ('status', 'orders', 'fills', 'performance', 'daily')
+
+
+@app.route('/snapshot')
+def snapshot():
+    """
+    Get several endpoints' payloads in one response.
+    
+    `include` is a comma-separated list of sections (status, orders, fills,
+    performance or perf, daily; default status,performance). Each section
+    has the same shape as its endpoint's default response; `limit` and
+    `days` apply to fills and daily as they do there.
+    """
+    include = request.args.get('include', default='status,performance', type=str)
+    sections = []
+    for name in include.split(','):
+        name = name.strip()
+        name = 'performance' if name == 'perf' else name
+        if name not in SNAPSHOT_SECTIONS:
+            raise BadRequest(f"Unknown snapshot section {name!r}")
+        if name not in sections:
+            sections.append(name)
+    limit = bounded_int_arg('limit', default=20, cap=200)
+    days = bounded_int_arg('days', default=10, cap=90)
+    
+    try:
+        now = datetime.utcnow()
+        parts = [b'{"timestamp":' + dumps(now)]
+        for name in sections:
+            if name == 'status':
+                body = dumps(cached(('status',), _build_status))
+            elif name == 'performance':
+                body = dumps(cached(('performance',), _build_performance))
+            elif name == 'daily':
+                body = dumps(cached(('daily', days), lambda: _build_daily(days)))
+            elif name == 'orders':
+                body = b''.join(_json_list_chunks(
+                    {"timestamp": now, "status_filter": 'active'},
+                    "orders",
+                    _orders_query(get_session(), 'active', limit),
+                    _order_record,
+                ))
+            else:
+                body = b''.join(_json_list_chunks(
+                    {"timestamp": now},
+                    "fills",
+                    _recent_fill_rows(get_session(), limit),
+                    _fill_record,
+                ))
+            parts.append(b'"' + name.encode() + b'":' + body)
+        return Response(b','.join(parts) + b'}', mimetype='application/json')
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, status=500)
+
+
+def sse_message(kind, data):
+    """Encode one server-sent event; data is JSON bytes or a JSON-serializable value."""
+    if not isinstance(data, bytes):
+        data = dumps(data)
+    return b'event: ' + kind.encode() + b'\ndata: ' + data + b'\n\n'
+
+
+def _fills_since(rowid_floor):
+    """
+    Get fills appended after rowid_floor (SQLite only).
+    
+    Returns:
+        Tuple of (high_rowid, fill rows). No rows are returned on the first
+        call (rowid_floor None), which just records the starting point.
+    """
+    with get_session() as session:
+        high_rowid = db.count_fills(session)  # MAX(rowid) on SQLite
+        if rowid_floor is None or high_rowid <= rowid_floor:
+            return high_rowid, []
+        rowid = literal_column("rowid")
+        new_fills = (
+            session.query(*FILL_COLUMNS)
+            .filter(rowid > rowid_floor, rowid <= high_rowid)
+            .order_by(rowid)
+            .all()
+        )
+        return high_rowid, new_fills
+
+
+@app.route('/stream')
+def stream():
+    """
+    Server-sent event stream of bot changes.
+    
+    On connect the current "status" and "performance" payloads are pushed;
+    after that each is pushed again only when it changes, and every new
+    fill is pushed as a "fill" event. Changes are detected from the shared
+    payload cache, so subscribers add no database load beyond one polling
+    client. Each subscriber holds a server worker thread while connected,
+    so at most STREAM_MAX_SUBSCRIBERS may connect (503 past that), and the
+    stream ends after STREAM_MAX_SECONDS for the client to reconnect.
+    """
+    if not _stream_slots.acquire(blocking=False):
+        response = json_response({"error": "too many stream subscribers"}, status=503)
+        response.headers['Retry-After'] = '30'
+        return response
+    
+    def generate():
+        signatures = {}
+        high_rowid = None
+        last_sent = 0.0
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        yield b'retry: %d\n\n' % STREAM_RETRY_MS
+        while time.monotonic() < deadline:
+            messages = []
+            try:
+                for kind, builder in (('status', _build_status), ('performance', _build_performance)):
+                    payload = cached((kind,), builder)
+                    signature = dumps({k: v for k, v in payload.items() if k != 'timestamp'})
+                    if signature != signatures.get(kind):
+                        signatures[kind] = signature
+                        messages.append(sse_message(kind, payload))
+                if db.engine.dialect.name == "sqlite":
+                    high_rowid, new_fills = _fills_since(high_rowid)
+                    messages.extend(sse_message('fill', _fill_record(fill)) for fill in new_fills)
+                signatures.pop('error', None)
+            except Exception as e:
+                if signatures.get('error') != str(e):
+                    signatures['error'] = str(e)
+                    messages.append(sse_message('error', {"error": str(e)}))
+            
+            now = time.monotonic()
+            if messages:
+                yield b''.join(messages)
+                last_sent = now
+            elif now - last_sent >= STREAM_KEEPALIVE_SECONDS:
+                yield b': keep-alive\n\n'
+                last_sent = now
+            time.sleep(STREAM_POLL_SECONDS)
+    
+    response = Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+    # Runs when the server closes the response, including on disconnects
+    response.call_on_close(_stream_slots.release)
+    return response
 
 
 @app.route('/reset', methods=['POST'])
@@ -356,7 +824,7 @@ def reset_paper_account():
     try:
         # This is a read-only API, so we can't actually reset
         # But we can provide instructions
-        return jsonify({
+        return json_response({
             "message": "This is a read-only monitoring API",
             "instructions": {
                 "manual_reset": "To reset paper account, use the Alpaca dashboard",
@@ -366,7 +834,7 @@ def reset_paper_account():
             "warning": "Resetting will close ALL positions and cancel ALL orders"
         })
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, status=500)
 
 
 @app.route('/admin/close_all', methods=['POST'])
@@ -375,14 +843,14 @@ def close_all_positions():
     Emergency endpoint - close all positions.
     Read-only API, returns instructions only.
     """
-    return jsonify({
+    return json_response({
         "message": "This is a read-only monitoring API",
         "instructions": {
             "manual": "Use Alpaca dashboard to close positions",
             "programmatic": "Use AlpacaClient.close_all_positions() method"
         },
         "warning": "This would close ALL open positions at market price"
-    }), 200
+    })
 
 
 def main():
@@ -392,7 +860,8 @@ def main():
     parser = argparse.ArgumentParser(description='Trading Bot API Server')
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to (default: 0.0.0.0)')
     parser.add_argument('--port', default=8080, type=int, help='Port to bind to (default: 8080)')
-    parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--debug', action='store_true', help='Enable debug mode (Flask dev server)')
+    parser.add_argument('--threads', default=8, type=int, help='Worker threads (default: 8)')
     
     args = parser.parse_args()
     
@@ -403,9 +872,20 @@ def main():
     print()
     print("Press Ctrl+C to stop")
     
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    if args.debug:
+        app.run(host=args.host, port=args.port, debug=True)
+        return
+    
+    try:
+        from waitress import serve
+    except ImportError:
+        print("⚠️  waitress not installed, falling back to the Flask dev server")
+        print("   Install it with: pip install -r requirements.txt")
+        app.run(host=args.host, port=args.port, threaded=True)
+        return
+    
+    serve(app, host=args.host, port=args.port, threads=args.threads)
 
 
 if __name__ == '__main__':
     main()
-
@@ -6,22 +6,99 @@ Usage:
     python examples/monitor_bot.py
     python examples/monitor_bot.py --host 192.168.1.100
     python examples/monitor_bot.py --watch --show-orders --show-fills
+    python examples/monitor_bot.py --stream --show-all
 """
 
 import requests
 import argparse
+import io
+import os
+import shutil
 import time
 import sys
+from contextlib import redirect_stdout
 from datetime import datetime
 from typing import Optional, Dict, List
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads
+except ImportError:  # Fall back to the stdlib decoder
+    from json import loads
+
+# (connect, read) timeout for every API call
+TIMEOUT = (2, 5)
+
+# /stream sends a keep-alive at least every 15s, so a longer silence means
+# the connection is gone
+STREAM_TIMEOUT = (2, 45)
+
+# Section header rule and the ANSI cursor-home + clear-to-end sequence
+SEP = "=" * 60
+CLEAR_SCREEN = '\033[H\033[0J'
+
+# Seconds to reuse slow-changing responses before asking the API again
+PERFORMANCE_TTL = 30
+DAILY_TTL = 600
+
+# Shared session so the watch loop reuses warm keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# url + params -> (fetched_at, JSON body) for cached_get
+_CACHE = {}
+
+
+def _cache_key(url, params):
+    """Build the _CACHE key for url + params."""
+    return (url, tuple(sorted(params.items())) if params else ())
+
+
+def cache_lookup(url, params, ttl):
+    """Get the cached response for url + params if younger than ttl, else None."""
+    entry = _CACHE.get(_cache_key(url, params))
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def cache_store(url, params, data):
+    """Remember a response for cache_lookup / cached_get."""
+    _CACHE[_cache_key(url, params)] = (time.monotonic(), data)
+
+
+def cached_get(url, params=None, ttl=30):
+    """
+    GET a JSON response through the shared session, reusing it for ttl seconds.
+    
+    Raises:
+        requests.RequestException: If the request fails (errors are not cached)
+    """
+    data = cache_lookup(url, params, ttl)
+    if data is not None:
+        return data
+    
+    response = SESSION.get(url, params=params, timeout=TIMEOUT)
+    response.raise_for_status()
+    data = loads(response.content)
+    cache_store(url, params, data)
+    return data
+
 
 def get_status(api_url):
     """Get bot status."""
     try:
-        response = requests.get(f"{api_url}/status", timeout=5)
+        response = SESSION.get(f"{api_url}/status", timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
     except requests.RequestException as e:
         print(f"❌ Error fetching status: {e}")
         return None
@@ -30,9 +107,7 @@ def get_status(api_url):
 def get_performance(api_url):
     """Get performance metrics."""
     try:
-        response = requests.get(f"{api_url}/performance", timeout=5)
-        response.raise_for_status()
-        return response.json()
+        return cached_get(f"{api_url}/performance", ttl=PERFORMANCE_TTL)
     except requests.RequestException as e:
         print(f"❌ Error fetching performance: {e}")
         return None
@@ -44,9 +119,9 @@ def get_orders(api_url, status='active', limit=10):
         params = {'status': status}
         if limit and status != 'active':
             params['limit'] = limit
-        response = requests.get(f"{api_url}/orders", params=params, timeout=5)
+        response = SESSION.get(f"{api_url}/orders", params=params, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
     except requests.RequestException as e:
         print(f"❌ Error fetching orders: {e}")
         return None
@@ -55,9 +130,9 @@ def get_orders(api_url, status='active', limit=10):
 def get_fills(api_url, limit=10):
     """Get recent fills."""
     try:
-        response = requests.get(f"{api_url}/fills?limit={limit}", timeout=5)
+        response = SESSION.get(f"{api_url}/fills?limit={limit}", timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
     except requests.RequestException as e:
         print(f"❌ Error fetching fills: {e}")
         return None
@@ -66,25 +141,35 @@ def get_fills(api_url, limit=10):
 def get_daily_pnl(api_url, days=7):
     """Get daily P&L."""
     try:
-        response = requests.get(f"{api_url}/daily?days={days}", timeout=5)
-        response.raise_for_status()
-        return response.json()
+        return cached_get(f"{api_url}/daily", {'days': days}, ttl=DAILY_TTL)
     except requests.RequestException as e:
         print(f"❌ Error fetching daily P&L: {e}")
         return None
 
 
+def get_snapshot(api_url, include, fills_limit=10, days=7):
+    """Get several sections (status, orders, fills, performance, daily) in one request."""
+    try:
+        params = {'include': ','.join(include), 'limit': fills_limit, 'days': days}
+        response = SESSION.get(f"{api_url}/snapshot", params=params, timeout=TIMEOUT)
+        response.raise_for_status()
+        return loads(response.content)
+    except requests.RequestException as e:
+        print(f"❌ Error fetching snapshot: {e}")
+        return None
+
+
 def print_status(status):
     """Print formatted status."""
     if not status:
         return
     
-    print("\n" + "="*60)
+    print("\n" + SEP)
     print("BOT STATUS")
-    print("="*60)
+    print(SEP)
     
     # Summary
-    print(f"⏰ Last check: {datetime.now().strftime('%H:%M:%S')}")
+    print(f"⏰ Last check: {datetime.now():%H:%M:%S}")
     print(f"📋 Active orders: {status.get('active_orders', 0)}")
     print(f"💰 Total fills: {status.get('total_fills', 0)}")
     
@@ -111,9 +196,9 @@ def print_performance(perf):
         print("\n💡 No trades yet")
         return
     
-    print("\n" + "="*60)
+    print("\n" + SEP)
     print("PERFORMANCE")
-    print("="*60)
+    print(SEP)
     
     # Overall stats
     win_rate = overall.get('win_rate_pct', 0)
@@ -155,9 +240,9 @@ def print_orders(orders_data, show_all=False):
         return
     
     status_filter = orders_data.get('status_filter', 'active')
-    print("\n" + "="*60)
+    print("\n" + SEP)
     print(f"ORDERS ({status_filter.upper()})")
-    print("="*60)
+    print(SEP)
     
     for order in orders[:10 if not show_all else None]:  # Limit to 10 unless show_all
         symbol = order['symbol']
@@ -191,9 +276,9 @@ def print_fills(fills_data):
         print("\n💰 No recent fills")
         return
     
-    print("\n" + "="*60)
+    print("\n" + SEP)
     print("RECENT FILLS")
-    print("="*60)
+    print(SEP)
     
     for fill in fills[:10]:  # Show last 10
         symbol = fill['symbol']
@@ -211,18 +296,18 @@ def print_daily_pnl(daily_data, days=7):
     if not daily_data:
         return
     
-    daily = daily_data.get('daily', [])
+    daily = daily_data.get('daily_pnl', [])
     if not daily:
         return
     
-    print("\n" + "="*60)
+    print("\n" + SEP)
     print(f"DAILY P&L (Last {days} days)")
-    print("="*60)
+    print(SEP)
     
     for day in daily[:days]:
         date = day['date'][:10]  # Just the date part
         pnl = day['pnl']
-        trades = day.get('num_trades', 0)
+        trades = day.get('trades', 0)
         
         # Create simple bar chart
         bar_length = int(abs(pnl) / 50)  # Scale: 1 char per $50
@@ -240,8 +325,216 @@ def print_daily_pnl(daily_data, days=7):
 
 def clear_screen():
     """Clear terminal screen."""
-    sys.stdout.write('\033[2J\033[H')
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+
+def memoized_printer(printer, key):
+    """
+    Wrap a section printer so its output is reused while key(data) is unchanged.
+    
+    Args:
+        printer: Section printer taking the section's response data
+        key: Callable returning a cheap fingerprint of the response data
+    """
+    last = {}
+    
+    def render(data):
+        fingerprint = key(data) if data else None
+        if 'text' not in last or last['key'] != fingerprint:
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                printer(data)
+            last.update(key=fingerprint, text=buffer.getvalue())
+        sys.stdout.write(last['text'])
+    
+    return render
+
+
+def _performance_key(perf):
+    """Fingerprint /performance by its trade count and total P&L."""
+    overall = perf.get('overall') or {}
+    return overall.get('total_trades'), overall.get('total_pnl')
+
+
+def _daily_key(daily_data):
+    """Fingerprint /daily by its length and most recent day."""
+    daily = daily_data.get('daily_pnl') or []
+    return (len(daily), daily[-1]['date'], daily[-1]['pnl']) if daily else ()
+
+
+def dashboard_sections(show_orders=False, show_fills=False, show_daily=False):
+    """
+    Build the ordered list of (section name, printer) pairs to display.
+    
+    Built once per run so the refresh loops don't re-check option flags.
+    Performance and daily P&L are only re-formatted when they change.
+    """
+    sections = [('status', print_status)]
+    if show_orders:
+        sections.append(('orders', print_orders))
+    if show_fills:
+        sections.append(('fills', print_fills))
+    sections.append(('performance', memoized_printer(print_performance, _performance_key)))
+    if show_daily:
+        sections.append(('daily', memoized_printer(
+            lambda daily: print_daily_pnl(daily, days=7), _daily_key
+        )))
+    return sections
+
+
+def write_stdout(text):
+    """Write text to the terminal in a single os.write where possible."""
     sys.stdout.flush()
+    data = text.encode(sys.stdout.encoding or 'utf-8', errors='replace')
+    fd = sys.stdout.fileno()
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def render_dashboard(data, sections, footer=None, clear=False, prev_frame=None):
+    """
+    Draw the given sections (and optional footer) with a single write.
+    
+    With clear, the frame is drawn from the top of the screen. If the
+    previous frame (this function's last return value) is passed, only the
+    lines that changed are rewritten in place.
+    
+    Returns:
+        List of the frame's lines
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        for name, printer in sections:
+            printer(data.get(name))
+        if footer:
+            print(footer)
+    text = buffer.getvalue()
+    frame = text.splitlines()
+    
+    if not clear:
+        write_stdout(text)
+    elif prev_frame is None or len(frame) >= shutil.get_terminal_size().lines:
+        # First frame, or too tall to address rows reliably: full redraw
+        write_stdout(CLEAR_SCREEN + text)
+    else:
+        changed = [
+            f"\033[{row};1H{line}\033[K"
+            for row, line in enumerate(frame, 1)
+            if row > len(prev_frame) or prev_frame[row - 1] != line
+        ]
+        # Park the cursor below the frame and erase anything left under it
+        write_stdout(''.join(changed) + f"\033[{len(frame) + 1};1H\033[0J")
+    return frame
+
+
+def fetch_dashboard(api_url, names):
+    """
+    Fetch the named sections (status, orders, fills, performance, daily) in
+    one /snapshot call.
+    
+    Performance and daily P&L still cached client-side are reused rather
+    than requested again.
+    
+    Returns:
+        Dict of section name -> response data (None on error)
+    """
+    data = {}
+    if 'performance' in names:
+        data['performance'] = cache_lookup(f"{api_url}/performance", None, PERFORMANCE_TTL)
+    if 'daily' in names:
+        data['daily'] = cache_lookup(f"{api_url}/daily", {'days': 7}, DAILY_TTL)
+    
+    include = [name for name in names if data.get(name) is None]
+    snapshot = get_snapshot(api_url, include, fills_limit=10, days=7) or {}
+    for name in include:
+        data[name] = snapshot.get(name)
+    if 'performance' in include and data['performance'] is not None:
+        cache_store(f"{api_url}/performance", None, data['performance'])
+    if 'daily' in include and data['daily'] is not None:
+        cache_store(f"{api_url}/daily", {'days': 7}, data['daily'])
+    return data
+
+
+def iter_sse(response):
+    """Yield (event, data) pairs from a server-sent events response."""
+    event, data = 'message', []
+    for line in response.iter_lines(decode_unicode=True):
+        if not line:
+            if data:
+                yield event, '\n'.join(data)
+            event, data = 'message', []
+        elif line.startswith(':'):
+            continue  # Keep-alive comment
+        elif line.startswith('event:'):
+            event = line[6:].strip()
+        elif line.startswith('data:'):
+            data.append(line[5:].lstrip())
+
+
+def monitor_stream(api_url, show_orders=False, show_fills=False, show_daily=False, clear=True):
+    """
+    Monitor bot from the server's /stream push channel.
+    
+    Redraws only when the server pushes a change. Orders and daily P&L are
+    re-fetched when a status or performance change arrives; pushed fills
+    are added to the local list.
+    
+    Returns:
+        False if the stream could not be opened (caller falls back to polling)
+    """
+    try:
+        response = SESSION.get(f"{api_url}/stream", stream=True, timeout=STREAM_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"⚠️  Push stream unavailable ({e}), falling back to polling")
+        return False
+    
+    print(f"📡 Streaming updates from {api_url}")
+    print("Press Ctrl+C to stop\n")
+    
+    sections = dashboard_sections(show_orders, show_fills, show_daily)
+    data = {}
+    frame = None
+    if show_fills:
+        data['fills'] = get_fills(api_url, limit=10)
+    try:
+        while True:
+            for event, payload in iter_sse(response):
+                message = loads(payload)
+                if event == 'status':
+                    data['status'] = message
+                    if show_orders:
+                        data['orders'] = get_orders(api_url)
+                elif event == 'performance':
+                    data['performance'] = message
+                    if show_daily:
+                        data['daily'] = get_daily_pnl(api_url, days=7)
+                elif event == 'fill':
+                    if data.get('fills') is not None:
+                        data['fills']['fills'] = [message] + data['fills'].get('fills', [])[:9]
+                elif event == 'error':
+                    print(f"❌ Server error: {message.get('error')}")
+                    continue
+                else:
+                    continue
+                
+                frame = render_dashboard(
+                    data, sections, "\n📡 Waiting for updates... (Ctrl+C to stop)", clear, frame
+                )
+            
+            # The server ends each stream after a few minutes; reconnect
+            response.close()
+            response = SESSION.get(f"{api_url}/stream", stream=True, timeout=STREAM_TIMEOUT)
+            response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"\n❌ Stream disconnected: {e}")
+    except KeyboardInterrupt:
+        print("\n\n👋 Stopped monitoring")
+    finally:
+        response.close()
+        SESSION.close()
+    return True
 
 
 def monitor_continuous(api_url, interval=30, show_orders=False, show_fills=False, show_daily=False, clear=True):
@@ -249,33 +542,21 @@ def monitor_continuous(api_url, interval=30, show_orders=False, show_fills=False
     print(f"🔄 Monitoring bot at {api_url} (refresh every {interval}s)")
     print("Press Ctrl+C to stop\n")
     
+    sections = dashboard_sections(show_orders, show_fills, show_daily)
+    names = [name for name, _ in sections]
+    footer = f"\n⏳ Next update in {interval} seconds... (Ctrl+C to stop)"
+    frame = None
     try:
         while True:
-            if clear:
-                clear_screen()
-            
-            status = get_status(api_url)
-            print_status(status)
-            
-            if show_orders:
-                orders = get_orders(api_url)
-                print_orders(orders)
-            
-            if show_fills:
-                fills = get_fills(api_url, limit=10)
-                print_fills(fills)
-            
-            perf = get_performance(api_url)
-            print_performance(perf)
-            
-            if show_daily:
-                daily = get_daily_pnl(api_url, days=7)
-                print_daily_pnl(daily, days=7)
-            
-            print(f"\n⏳ Next update in {interval} seconds... (Ctrl+C to stop)")
+            # One round-trip per tick for every section shown; only changed
+            # lines are redrawn
+            data = fetch_dashboard(api_url, names)
+            frame = render_dashboard(data, sections, footer, clear, frame)
             time.sleep(interval)
     except KeyboardInterrupt:
         print("\n\n👋 Stopped monitoring")
+    finally:
+        SESSION.close()
 
 
 def main():
@@ -290,18 +571,22 @@ Examples:
   python examples/monitor_bot.py --watch --show-fills     # Show recent fills
   python examples/monitor_bot.py --watch --show-daily     # Show daily P&L chart
   python examples/monitor_bot.py --watch --show-all       # Show everything
+  python examples/monitor_bot.py --stream --show-all      # Redraw on server push
   python examples/monitor_bot.py --host 192.168.1.100 --watch  # Monitor remote bot
         """
     )
     parser.add_argument('--host', default='localhost', help='API host (default: localhost)')
     parser.add_argument('--port', type=int, default=8080, help='API port (default: 8080)')
     parser.add_argument('--watch', action='store_true', help='Continuous monitoring mode')
+    parser.add_argument('--stream', action='store_true',
+                        help='Continuous monitoring from the server push channel (falls back to --watch)')
     parser.add_argument('--interval', type=int, default=30, help='Update interval in seconds (default: 30)')
     parser.add_argument('--show-orders', action='store_true', help='Show active orders')
     parser.add_argument('--show-fills', action='store_true', help='Show recent fills')
     parser.add_argument('--show-daily', action='store_true', help='Show daily P&L chart')
     parser.add_argument('--show-all', action='store_true', help='Show all information')
-    parser.add_argument('--no-clear', action='store_true', help='Don\'t clear screen between updates')
+    parser.add_argument('--clear', action=argparse.BooleanOptionalAction, default=True,
+                        help='Clear screen between updates (default: on)')
     
     args = parser.parse_args()
     api_url = f"http://{args.host}:{args.port}"
@@ -314,7 +599,7 @@ Examples:
     
     # Check if API is reachable
     try:
-        response = requests.get(f"{api_url}/health", timeout=5)
+        response = SESSION.get(f"{api_url}/health", timeout=TIMEOUT)
         if response.status_code != 200:
             print(f"❌ API not healthy at {api_url}")
             print("Make sure the API server is running: ./run_api.sh")
@@ -326,34 +611,29 @@ Examples:
     
     print(f"✅ Connected to {api_url}")
     
-    if args.watch:
+    if args.stream and monitor_stream(
+        api_url,
+        show_orders=args.show_orders,
+        show_fills=args.show_fills,
+        show_daily=args.show_daily,
+        clear=args.clear
+    ):
+        return
+    
+    if args.watch or args.stream:
         monitor_continuous(
             api_url, 
             args.interval,
             show_orders=args.show_orders,
             show_fills=args.show_fills,
             show_daily=args.show_daily,
-            clear=not args.no_clear
+            clear=args.clear
         )
     else:
         # Single check
-        status = get_status(api_url)
-        print_status(status)
-        
-        if args.show_orders:
-            orders = get_orders(api_url)
-            print_orders(orders)
-        
-        if args.show_fills:
-            fills = get_fills(api_url, limit=10)
-            print_fills(fills)
-        
-        perf = get_performance(api_url)
-        print_performance(perf)
-        
-        if args.show_daily:
-            daily = get_daily_pnl(api_url, days=7)
-            print_daily_pnl(daily, days=7)
+        sections = dashboard_sections(args.show_orders, args.show_fills, args.show_daily)
+        data = fetch_dashboard(api_url, [name for name, _ in sections])
+        render_dashboard(data, sections)
         
         print("\n💡 Tip: Use --watch for continuous monitoring")
         print("💡 Tip: Use --show-all to see everything")
@@ -6,19 +6,21 @@ Python-based alternative to run_tests.sh for Windows compatibility.
 
 import sys
 import argparse
-import subprocess
+import importlib.util
 from pathlib import Path
 
 
-def run_command(cmd, description=""):
-    """Run a command and return the exit code."""
+def run_pytest(args, description=""):
+    """Run pytest in this interpreter and return its exit code."""
+    import pytest
+    
     if description:
         print(f"\n{'='*60}")
         print(f"  {description}")
         print('='*60)
+    sys.stdout.flush()
     
-    result = subprocess.run(cmd, shell=False)
-    return result.returncode
+    return int(pytest.main(args))
 
 
 def main():
@@ -32,6 +34,7 @@ Examples:
   python run_tests.py --coverage   # Run with coverage report
   python run_tests.py --file test_api_server.py
   python run_tests.py --fast       # Run tests quickly
+  python run_tests.py --jobs auto  # Run test files in parallel (needs pytest-xdist)
         """
     )
     
@@ -65,6 +68,12 @@ Examples:
         action='store_true',
         help='Run tests without verbosity (fast mode)'
     )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        default='1',
+        help='Parallel workers: a number or "auto" (requires pytest-xdist, default: 1)'
+    )
     parser.add_argument(
         '--verbose',
         '-v',
@@ -77,18 +86,15 @@ Examples:
     # Change to script directory
     script_dir = Path(__file__).parent
     
-    # Check if pytest is available
-    try:
-        subprocess.run(['pytest', '--version'], 
-                      capture_output=True, 
-                      check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if pytest is available (in-process, no subprocess needed)
+    if importlib.util.find_spec('pytest') is None:
         print("❌ Error: pytest is not installed!")
         print("Install it with: pip install -r requirements.txt")
         return 1
     
-    # Build pytest command
-    cmd = ['pytest']
+    # Build pytest arguments; pytest runs in-process, so no second
+    # interpreter is started
+    pytest_args = []
     
     # Determine which tests to run
     if args.file:
@@ -98,33 +104,42 @@ Examples:
             if not test_path.exists():
                 print(f"❌ Error: Test file not found: {args.file}")
                 return 1
-        cmd.append(str(test_path))
+        pytest_args.append(str(test_path))
         description = f"Running Test File: {args.file}"
     elif args.unit:
-        cmd.extend(['tests/', '-m', 'unit'])
+        pytest_args.extend(['tests/', '-m', 'unit'])
         description = "Running Unit Tests"
     elif args.integration:
-        cmd.extend(['tests/', '-m', 'integration'])
+        pytest_args.extend(['tests/', '-m', 'integration'])
         description = "Running Integration Tests"
     elif args.api:
-        cmd.append('tests/test_api_server.py')
+        pytest_args.append('tests/test_api_server.py')
         description = "Running API Tests"
     else:
-        cmd.append('tests/')
+        pytest_args.append('tests/')
         description = "Running All Tests"
     
     # Add options
     if args.coverage:
-        cmd.extend(['--cov=src', '--cov-report=html', '--cov-report=term'])
+        pytest_args.extend(['--cov=src', '--cov-report=html', '--cov-report=term'])
         description += " with Coverage"
     
+    if args.jobs != '1':
+        if importlib.util.find_spec('xdist') is None:
+            print("❌ Error: --jobs requires pytest-xdist!")
+            print("Install it with: pip install -r requirements.txt")
+            return 1
+        # Keep each file on one worker so module-level fixtures stay shared
+        pytest_args.extend(['-n', args.jobs, '--dist=loadfile'])
+        description += f" ({args.jobs} workers)"
+    
     if args.fast:
-        cmd.extend(['--tb=short', '-q'])
+        pytest_args.extend(['--tb=short', '-q'])
     else:
-        cmd.append('-v')
+        pytest_args.append('-v')
     
     # Run the tests
-    exit_code = run_command(cmd, description)
+    exit_code = run_pytest(pytest_args, description)
     
     # Print results
     print()
@@ -8,16 +8,21 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.database import DatabaseManager
+from sqlalchemy import select, text
+
+from src.database import (
+    ACTIVE_ORDER_STATUSES, DatabaseManager, EventRecord, FillRecord, OrderRecord, SymbolState,
+)
+
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def format_timestamp(ts):
-    """Format timestamp for display."""
+    """Format timestamp for display (DateTime columns always load as datetime)."""
     if ts is None:
         return "None"
-    if isinstance(ts, str):
-        return ts
-    return ts.strftime("%Y-%m-%d %H:%M:%S")
+    return ts.strftime(TIMESTAMP_FORMAT)
 
 
 def main():
@@ -30,16 +35,25 @@ def main():
     print()
     
     with db.get_session() as session:
+        if db.engine.dialect.name == "sqlite":
+            # Read-only report: let SQLite skip write-transaction setup
+            session.execute(text("PRAGMA query_only=1"))
+        
+        # Plain column rows throughout - nothing here needs ORM instances
+        
         # Symbol states
         print("📊 SYMBOL STATES")
         print("-" * 60)
-        states = session.query(db.SymbolState).all()
+        states = session.execute(
+            select(SymbolState.symbol, SymbolState.cooldown_until_ts)
+        ).all()
         if states:
-            for state in states:
-                cooldown_str = format_timestamp(state.cooldown_until_ts)
-                in_cooldown = state.cooldown_until_ts and state.cooldown_until_ts > datetime.utcnow()
+            now = datetime.utcnow()
+            for symbol, cooldown_until_ts in states:
+                cooldown_str = format_timestamp(cooldown_until_ts)
+                in_cooldown = cooldown_until_ts and cooldown_until_ts > now
                 status = "🔴 COOLDOWN" if in_cooldown else "🟢 ACTIVE"
-                print(f"{state.symbol:6s} | {status} | Cooldown until: {cooldown_str}")
+                print(f"{symbol:6s} | {status} | Cooldown until: {cooldown_str}")
         else:
             print("No symbol states found")
         print()
@@ -47,9 +61,17 @@ def main():
         # Active orders
         print("📋 ACTIVE ORDERS")
         print("-" * 60)
-        active_orders = db.get_active_orders(session)
+        active_orders = session.execute(
+            select(
+                OrderRecord.order_id, OrderRecord.symbol, OrderRecord.side,
+                OrderRecord.order_type, OrderRecord.qty, OrderRecord.status,
+            )
+            .where(OrderRecord.status.in_(ACTIVE_ORDER_STATUSES))
+            .order_by(OrderRecord.created_at.desc())
+            .limit(10)  # Show last 10
+        ).all()
         if active_orders:
-            for order in active_orders[:10]:  # Show last 10
+            for order in active_orders:
                 print(f"Order {order.order_id} | {order.symbol:6s} | {order.side:4s} | "
                       f"{order.order_type:8s} | Qty: {order.qty} | Status: {order.status}")
         else:
@@ -59,17 +81,15 @@ def main():
         # Recent fills
         print("💰 RECENT FILLS (Last 10)")
         print("-" * 60)
-        from src.database import FillRecord
-        recent_fills = (
-            session.query(FillRecord)
+        recent_fills = session.execute(
+            select(FillRecord.ts, FillRecord.symbol, FillRecord.side, FillRecord.qty, FillRecord.price)
             .order_by(FillRecord.ts.desc())
             .limit(10)
-            .all()
-        )
+        ).all()
         if recent_fills:
-            for fill in recent_fills:
-                print(f"{format_timestamp(fill.ts)} | {fill.symbol:6s} | {fill.side:4s} | "
-                      f"Qty: {fill.qty} @ ${fill.price:.2f}")
+            for ts, symbol, side, qty, price in recent_fills:
+                print(f"{format_timestamp(ts)} | {symbol:6s} | {side:4s} | "
+                      f"Qty: {qty} @ ${price:.2f}")
         else:
             print("No fills yet")
         print()
@@ -77,17 +97,15 @@ def main():
         # Recent events
         print("📝 RECENT EVENTS (Last 10)")
         print("-" * 60)
-        from src.database import EventRecord
-        recent_events = (
-            session.query(EventRecord)
+        recent_events = session.execute(
+            select(EventRecord.ts, EventRecord.symbol, EventRecord.event_type)
             .order_by(EventRecord.ts.desc())
             .limit(10)
-            .all()
-        )
+        ).all()
         if recent_events:
-            for event in recent_events:
-                symbol_str = event.symbol if event.symbol else "SYSTEM"
-                print(f"{format_timestamp(event.ts)} | {symbol_str:6s} | {event.event_type}")
+            for ts, symbol, event_type in recent_events:
+                symbol_str = symbol if symbol else "SYSTEM"
+                print(f"{format_timestamp(ts)} | {symbol_str:6s} | {event_type}")
         else:
             print("No events logged")
         print()
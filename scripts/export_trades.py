@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Export trades to CSV for analysis."""
 
+import argparse
+import gzip
+import io
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -14,6 +17,13 @@ from src.performance import PerformanceTracker
 
 def main():
     """Export trades to CSV."""
+    parser = argparse.ArgumentParser(description='Export closed trades to CSV')
+    parser.add_argument('--gzip', action='store_true',
+                        help='Write a gzip-compressed .csv.gz file (fast compression level)')
+    parser.add_argument('--buffer-size', type=int, default=1 << 20,
+                        help='Write buffer size in bytes, also used with --gzip (default: 1 MiB)')
+    args = parser.parse_args()
+    
     db = DatabaseManager("sqlite:///bot.db")
     tracker = PerformanceTracker(db)
     
@@ -21,17 +31,27 @@ def main():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"trades_{timestamp}.csv"
     
-    with db.get_session() as session:
-        tracker.export_trades_to_csv(session, filename)
-        
-        # Count trades
-        trades = tracker.calculate_closed_trades(session)
-        print(f"✅ Exported {len(trades)} trades to {filename}")
-        
-        if trades:
-            print(f"\nFirst trade: {trades[0]['entry_ts']}")
-            print(f"Last trade: {trades[-1]['exit_ts']}")
-            print(f"\nTotal P&L: ${sum(t['pnl'] for t in trades):,.2f}")
+    if args.gzip:
+        filename += ".gz"
+        # Buffer ahead of the compressor so it sees large writes, not one per CSV row
+        raw = io.BufferedWriter(gzip.GzipFile(filename, 'wb', compresslevel=1),
+                                buffer_size=args.buffer_size)
+        output = io.TextIOWrapper(raw, newline='')
+    else:
+        output = open(filename, 'w', newline='', buffering=args.buffer_size)
+    
+    with output, db.get_session() as session:
+        summary = tracker.export_trades_to_csv(session, filename, fileobj=output)
+    
+    if not summary['count']:
+        Path(filename).unlink(missing_ok=True)
+        print("No closed trades to export")
+        return
+    
+    print(f"✅ Exported {summary['count']} trades to {filename}")
+    print(f"\nFirst trade: {summary['first_entry_ts']}")
+    print(f"Last trade: {summary['last_exit_ts']}")
+    print(f"\nTotal P&L: ${summary['total_pnl']:,.2f}")
 
 
 if __name__ == "__main__":
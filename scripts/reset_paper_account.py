@@ -12,22 +12,39 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.alpaca_client import AlpacaClient
 from src.config import BotConfig
-import structlog
 
-# Configure logging
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(),
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(20),  # INFO level
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-)
 
-logger = structlog.get_logger()
+def configure_logging():
+    """Configure console logging (deferred until the script will actually trade)."""
+    import structlog
+    
+    structlog.configure(
+        processors=[
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer(),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(20),  # INFO level
+        context_class=dict,
+        logger_factory=structlog.PrintLoggerFactory(),
+    )
+    return structlog.get_logger()
+
+
+async def wait_until(predicate, timeout=10.0, interval=0.5):
+    """
+    Poll the async predicate() until it returns True or timeout seconds pass.
+    
+    Returns:
+        True if the predicate was satisfied, False on timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not await predicate():
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(interval)
+    return True
 
 
 async def main():
@@ -68,6 +85,10 @@ async def main():
     print()
     print("Connecting to Alpaca...")
     
+    # The Alpaca SDK is only imported once we know it will be used
+    logger = configure_logging()
+    from src.alpaca_client import AlpacaClient
+    
     # Connect to Alpaca
     client = AlpacaClient(config)
     try:
@@ -75,14 +96,13 @@ async def main():
         print("✅ Connected!")
         print()
         
-        # Get current state
+        # Get current state (positions and orders are fetched concurrently)
         print("📊 Current Account State:")
-        positions = client.get_positions()
+        positions, _, orders = await client.snapshot()
         print(f"   Open Positions: {len(positions)}")
         for symbol, pos in positions.items():
             print(f"      - {symbol}: {pos['quantity']} shares")
         
-        orders = client.get_open_orders()
         print(f"   Open Orders: {len(orders)}")
         for order_wrapper in orders:
             print(f"      - {order_wrapper.contract.symbol}: {order_wrapper.order.side.value} {order_wrapper.order.type.value}")
@@ -92,7 +112,7 @@ async def main():
         # Reset account
         if len(positions) > 0 or len(orders) > 0:
             print("🔄 Resetting account...")
-            result = client.reset_paper_account()
+            result = await asyncio.to_thread(client.reset_paper_account)
             
             if result:
                 print("✅ Account reset successful!")
@@ -101,10 +121,20 @@ async def main():
                 print("   - All orders cancelled")
                 print()
                 
-                # Verify
-                await asyncio.sleep(2)  # Give API time to process
-                positions_after = client.get_positions()
-                orders_after = client.get_open_orders()
+                # Verify - wait only as long as the broker needs to settle,
+                # reading fresh state on every poll rather than the caches
+                async def account_flat():
+                    client.invalidate_account_caches()
+                    positions, orders = await asyncio.gather(
+                        client.fetch_positions(), client.fetch_open_orders()
+                    )
+                    return not positions and not orders
+                
+                if not await wait_until(account_flat, timeout=10):
+                    print("⚠️  Account still not flat after 10s; showing its current state.")
+                    print()
+                client.invalidate_account_caches()
+                positions_after, _, orders_after = await client.snapshot()
                 
                 print("📊 Account State After Reset:")
                 print(f"   Open Positions: {len(positions_after)}")
@@ -5,10 +5,17 @@ from __future__ import annotations
 from typing import Optional, Dict, Callable, List
 from decimal import Decimal, ROUND_DOWN
 import asyncio
+import bisect
+from collections import namedtuple
+import math
+import threading
+import time
+from urllib.parse import urlsplit
 import structlog
-from datetime import datetime
+from cachetools import TTLCache
 
 from alpaca.trading.client import TradingClient
+from alpaca.trading.stream import TradingStream
 from alpaca.trading.requests import (
     MarketOrderRequest,
     LimitOrderRequest,
@@ -26,23 +33,199 @@ from alpaca.trading.enums import (
 )
 from alpaca.data.historical import StockHistoricalDataClient, CryptoHistoricalDataClient
 from alpaca.data.requests import StockLatestQuoteRequest, CryptoLatestQuoteRequest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from src.config import BotConfig
+from src.config import BotConfig, RateLimitConfig
+
+try:
+    import orjson
+except ImportError:  # Responses are decoded by requests' stdlib json
+    orjson = None
 
 logger = structlog.get_logger()
 
+# While the trade_updates stream is up, check_for_events only re-polls
+# closed orders this often as a safety net
+STREAM_RECONCILE_SECONDS = 60
+
+# Auto-detected tick sizes: (price upper bound, tick, 1 / tick)
+_TICK_TABLE = [
+    (0.01, 1e-7, 10_000_000),   # Very small prices (like SHIB at $0.00001)
+    (1.0, 1e-4, 10_000),        # Small prices (like some altcoins)
+    (float("inf"), 1e-2, 100),  # Standard 2 decimal places
+]
+_TICK_BOUNDS = [bound for bound, _, _ in _TICK_TABLE]
+
+
+def _floor_to_inverse_tick(price: float, inverse: int) -> float:
+    """Round price down to a multiple of 1 / inverse."""
+    # price * inverse can be off by one either way (0.29 * 100 is
+    # 28.999999999999996), so settle on the largest n with n / inverse <= price.
+    # That is exactly floor(Decimal(str(price)) * inverse): int / int division
+    # is correctly rounded, and repr(price) falls on the same side of n / inverse.
+    n = math.floor(price * inverse)
+    if (n + 1) / inverse <= price:
+        n += 1
+    elif n / inverse > price:
+        n -= 1
+    return n / inverse
+
+
+# (output key, SDK attribute) pairs read by get_account_summary/get_positions
+_ACCOUNT_FIELDS = (
+    ('NetLiquidation', 'equity'),
+    ('TotalCashValue', 'cash'),
+    ('GrossPositionValue', 'long_market_value'),
+    ('AvailableFunds', 'cash'),
+    ('BuyingPower', 'buying_power'),
+)
+_POSITION_FIELDS = (
+    ("quantity", "qty"),
+    ("avg_cost", "avg_entry_price"),
+    ("market_value", "market_value"),
+    ("current_price", "current_price"),
+)
+
+
+def _float_attr(obj, attr: str, default: Optional[float] = 0.0) -> Optional[float]:
+    """Read a numeric SDK field (often a string) as float, or default if missing/invalid."""
+    value = getattr(obj, attr, None)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+# Order status values that carry a fill / end an order's life
+# Only a fully filled order dispatches the fill callback: the stream also
+# reports partially_filled updates while an order is still working, and
+# the fill is reported once with its final cumulative quantity
+FILLED_STATUS = 'filled'
+TERMINAL_STATUSES = frozenset({'filled', 'canceled', 'expired', 'rejected'})
+
+# Order list queries are fixed, so validate them once rather than per poll
+OPEN_ORDERS_REQUEST = GetOrdersRequest(status=QueryOrderStatus.OPEN)
+CLOSED_ORDERS_REQUEST = GetOrdersRequest(status=QueryOrderStatus.CLOSED, limit=50)
+
+# Order submissions/cancellations in flight at once (Alpaca has no batch order endpoint)
+MAX_CONCURRENT_ORDERS = 8
+
+# Bounds on tracked_orders so missed terminal updates can't leak entries
+TRACKED_ORDERS_MAX = 10_000
+TRACKED_ORDERS_TTL_SECONDS = 86400
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket; acquire() blocks until a request may be sent.
+    
+    The wait is a plain sleep, so throttled requests must be made from worker
+    threads (asyncio.to_thread), never from the event loop thread.
+    """
+    
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class _ThrottledSession(requests.Session):
+    """
+    Session that rate-limits requests per host.
+    
+    Alpaca limits trading and market data API calls separately, so each host
+    (api.alpaca.markets, data.alpaca.markets, ...) gets its own bucket.
+    """
+    
+    def __init__(self, rate_limit: RateLimitConfig):
+        super().__init__()
+        self._rate_limit = rate_limit
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+    
+    def request(self, method, url, *args, **kwargs):
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._buckets_lock:
+                bucket = self._buckets.setdefault(host, _TokenBucket(
+                    self._rate_limit.requests_per_minute / 60, self._rate_limit.burst
+                ))
+        bucket.acquire()
+        return super().request(method, url, *args, **kwargs)
+
+
+def _pooled_session(rate_limit: RateLimitConfig) -> requests.Session:
+    """
+    Build a keep-alive HTTP session for the SDK clients to share.
+    
+    Sized for concurrent calls from worker threads; only connection failures
+    are retried here, status retries are left to the SDK. Requests are
+    throttled below Alpaca's rate limits, and replies are decoded with orjson
+    when it is installed.
+    """
+    session = _ThrottledSession(rate_limit)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=()),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if orjson is not None:
+        session.hooks["response"].append(_orjson_response_hook)
+    return session
+
+
+def _orjson_response_hook(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """Make response.json(), which the SDK decodes every REST reply with, use orjson."""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+# IB-style views of Alpaca orders/fills consumed by the bot and state machines
+Contract = namedtuple("Contract", ["symbol"])
+OrderStatus = namedtuple("OrderStatus", ["status"])
+Execution = namedtuple("Execution", ["shares", "price", "execId"])
+Fill = namedtuple("Fill", ["execution"])
+
 
 class AlpacaOrder:
     """Wrapper for Alpaca order to provide consistent interface."""
     
+    __slots__ = ("order", "contract", "orderStatus")
+    
     def __init__(self, alpaca_order):
         self.order = alpaca_order
-        self.contract = type('obj', (object,), {'symbol': alpaca_order.symbol})()
-        self.orderStatus = type('obj', (object,), {'status': alpaca_order.status.value})()
+        self.contract = Contract(alpaca_order.symbol)
+        self.orderStatus = OrderStatus(alpaca_order.status.value)
 
 
 class AlpacaClient:
-    """Wrapper for Alpaca Trading API."""
+    """
+    Wrapper for Alpaca Trading API.
+    
+    The alpaca-py SDK is synchronous, so async methods run its calls in a
+    worker thread (asyncio.to_thread) rather than blocking the event loop.
+    """
 
     def __init__(self, config: BotConfig):
         """Initialize Alpaca client."""
@@ -52,14 +235,43 @@ class AlpacaClient:
         # Initialize Alpaca clients
         self.trading_client = None
         self.data_client = None
+        self._http: Optional[requests.Session] = None
+        self.trade_stream: Optional[TradingStream] = None
+        self._stream_task: Optional[asyncio.Task] = None
         
         # Event handlers
         self.on_fill_callback: Optional[Callable] = None
         self.on_order_status_callback: Optional[Callable] = None
         
-        # Track orders for event handling
-        self.tracked_orders: Dict[str, AlpacaOrder] = {}
-        self.last_order_check = datetime.min
+        # Track orders for event handling. Terminal orders are dropped as
+        # their updates arrive; the size/age bound catches any we never see.
+        self.tracked_orders: TTLCache[str, AlpacaOrder] = TTLCache(
+            maxsize=TRACKED_ORDERS_MAX, ttl=TRACKED_ORDERS_TTL_SECONDS
+        )
+        # Last (status, filled_qty) handled per order, so the closed-orders
+        # poll doesn't re-dispatch orders that haven't changed since
+        self._handled_states: TTLCache[str, tuple] = TTLCache(
+            maxsize=TRACKED_ORDERS_MAX, ttl=TRACKED_ORDERS_TTL_SECONDS
+        )
+        # time.monotonic() of the last successful closed-orders poll
+        self.last_order_check: Optional[float] = None
+        
+        # Short-lived read caches: value plus time.monotonic() when fetched.
+        # Concurrent lookups of a symbol share its in-flight fetch.
+        self._price_cache: Dict[str, tuple[float, float]] = {}
+        self._price_inflight: Dict[str, asyncio.Future] = {}
+        self._order_slots = asyncio.Semaphore(MAX_CONCURRENT_ORDERS)
+        
+        # Symbol -> is crypto (the watchlist never changes at runtime)
+        self._is_crypto_cache: Dict[str, bool] = {}
+        self._positions_cache: Optional[tuple[Dict[str, dict], float]] = None
+        self._open_orders_cache: Optional[tuple[List[AlpacaOrder], float]] = None
+        self._account_cache: Optional[tuple[object, float]] = None
+        self._account_lock = threading.Lock()
+        
+        # Symbols kept warm in _price_cache by the background refresher
+        self._watched_symbols: List[str] = []
+        self._refresh_task: Optional[asyncio.Task] = None
         
         logger.info("alpaca_client_initialized")
 
@@ -80,10 +292,25 @@ class AlpacaClient:
             )
             self.crypto_data_client = CryptoHistoricalDataClient()  # No auth needed for crypto data
             
+            # alpaca-py gives each client its own default-sized requests
+            # session; share one pooled keep-alive session instead
+            self._http = _pooled_session(self.config.rate_limit)
+            for client in (self.trading_client, self.data_client, self.crypto_data_client):
+                if hasattr(client, "_session"):
+                    client._session = self._http
+            
             # Test connection
-            account = self.trading_client.get_account()
+            account = await asyncio.to_thread(self.trading_client.get_account)
             self.connected = True
             
+            if self.config.polling.use_trade_stream:
+                self._start_trade_stream()
+            
+            if self.config.cache.price_refresh_seconds > 0:
+                self._refresh_task = asyncio.create_task(
+                    self._price_refresh_loop(self.config.cache.price_refresh_seconds)
+                )
+            
             logger.info(
                 "alpaca_connected",
                 account_number=account.account_number,
@@ -94,9 +321,38 @@ class AlpacaClient:
             logger.error("alpaca_connection_failed", error=str(e))
             raise
 
+    def _start_trade_stream(self):
+        """Subscribe to order updates over the trade_updates websocket."""
+        self.trade_stream = TradingStream(
+            api_key=self.config.alpaca.api_key,
+            secret_key=self.config.alpaca.secret_key,
+            paper=self.config.mode == "paper",
+        )
+        self.trade_stream.subscribe_trade_updates(self._on_trade_update)
+        # TradingStream.run() starts its own event loop; run the coroutine
+        # it wraps (which reconnects on errors) on ours instead
+        self._stream_task = asyncio.create_task(self.trade_stream._run_forever())
+        logger.info("trade_stream_started")
+
     async def disconnect(self):
         """Disconnect from Alpaca (cleanup)."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        
+        if self._stream_task is not None:
+            try:
+                await self.trade_stream.stop_ws()
+            except Exception as e:
+                logger.warning("trade_stream_stop_failed", error=str(e))
+            self._stream_task.cancel()
+            self._stream_task = None
+            self.trade_stream = None
+        
         if self.connected:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
             self.trading_client = None
             self.data_client = None
             self.crypto_data_client = None
@@ -113,40 +369,135 @@ class AlpacaClient:
         Returns:
             Last price or None if unavailable
         """
+        return (await self.get_last_prices([symbol]))[symbol]
+
+    async def get_last_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get last prices for several symbols in at most two requests.
+        
+        Stocks and crypto are each priced with one multi-symbol latest-quote
+        request, and the two requests run concurrently.
+        
+        Args:
+            symbols: Stock and/or crypto symbols
+            
+        Returns:
+            Dict of symbol -> last price (None if unavailable)
+        """
+        ttl = self.config.cache.price_ttl_seconds
+        if self._refresh_task is not None and not self._refresh_task.done():
+            # Watched symbols are refetched every interval; don't let a
+            # read that lands just before the next refresh go to the network
+            ttl += self.config.cache.price_refresh_seconds
+        
+        def cached(now):
+            found = {}
+            for symbol in symbols:
+                entry = self._price_cache.get(symbol)
+                if entry is not None and now - entry[1] < ttl:
+                    found[symbol] = entry[0]
+            return found
+        
+        prices = cached(time.monotonic())
+        if len(prices) < len(symbols):
+            # Join fetches already in flight for some symbols; fetch the rest
+            missing = [symbol for symbol in symbols if symbol not in prices]
+            pending = {symbol: self._price_inflight[symbol] for symbol in missing if symbol in self._price_inflight}
+            to_fetch = [symbol for symbol in missing if symbol not in pending]
+            if to_fetch:
+                prices.update(await self._fetch_and_cache_prices(to_fetch))
+            for symbol, future in pending.items():
+                prices[symbol] = await asyncio.shield(future)
+        
+        return {symbol: prices.get(symbol) for symbol in symbols}
+
+    def register_watched_symbols(self, symbols) -> None:
+        """Set the symbols whose prices the background refresher keeps cached."""
+        self._watched_symbols = list(symbols)
+
+    async def _price_refresh_loop(self, interval: float):
+        """Refetch watched symbols' prices into _price_cache every interval seconds."""
+        logger.info("price_refresh_started", interval=interval, symbols=len(self._watched_symbols))
+        while True:
+            if self._watched_symbols:
+                try:
+                    await self._fetch_and_cache_prices(self._watched_symbols)
+                except Exception as e:
+                    logger.warning("price_refresh_failed", error=str(e))
+            await asyncio.sleep(interval)
+
+    async def _fetch_and_cache_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Fetch prices into _price_cache, publishing each symbol's fetch in
+        _price_inflight so concurrent callers await it instead of refetching.
+        """
+        loop = asyncio.get_running_loop()
+        owned = {}
+        for symbol in symbols:
+            if symbol not in self._price_inflight:
+                owned[symbol] = self._price_inflight[symbol] = loop.create_future()
+        
+        fetched = {}
         try:
+            fetched = await self._fetch_last_prices(symbols)
+            now = time.monotonic()
+            for symbol, price in fetched.items():
+                if price is not None:
+                    self._price_cache[symbol] = (price, now)
+            return fetched
+        finally:
+            # Waiters get None if the fetch failed or was cancelled
+            for symbol, future in owned.items():
+                future.set_result(fetched.get(symbol))
+                del self._price_inflight[symbol]
+
+    async def _fetch_last_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """Fetch last prices from Alpaca, one request per asset class."""
+        stocks, crypto = [], []
+        for symbol in symbols:
             # Detect if symbol is crypto (contains '/')
-            is_crypto = '/' in symbol or self.config.is_crypto_symbol(symbol)
-            
+            if self._is_crypto(symbol):
+                crypto.append(symbol)
+            else:
+                stocks.append(symbol)
+        
+        fetches = []
+        if stocks:
+            fetches.append(self._fetch_quote_prices(stocks, is_crypto=False))
+        if crypto:
+            fetches.append(self._fetch_quote_prices(crypto, is_crypto=True))
+        
+        prices = dict.fromkeys(symbols)
+        for fetched in await asyncio.gather(*fetches):
+            prices.update(fetched)
+        return prices
+
+    async def _fetch_quote_prices(self, symbols: List[str], is_crypto: bool) -> Dict[str, float]:
+        """Price one asset class's symbols with a single latest-quote request."""
+        try:
             if is_crypto:
                 # Use crypto data API
-                request = CryptoLatestQuoteRequest(symbol_or_symbols=symbol)
-                quotes = self.crypto_data_client.get_crypto_latest_quote(request)
-                
-                if symbol in quotes:
-                    quote = quotes[symbol]
-                    # Use mid-point of bid/ask for better pricing
-                    price = (quote.bid_price + quote.ask_price) / 2.0
-                    logger.debug("crypto_price_fetched", symbol=symbol, price=price)
-                    return float(price)
+                request = CryptoLatestQuoteRequest(symbol_or_symbols=symbols)
+                quotes = await asyncio.to_thread(self.crypto_data_client.get_crypto_latest_quote, request)
             else:
                 # Use stock data API
-                request = StockLatestQuoteRequest(symbol_or_symbols=symbol)
-                quotes = self.data_client.get_stock_latest_quote(request)
-                
-                if symbol in quotes:
-                    quote = quotes[symbol]
-                    # Use mid-point of bid/ask for better pricing
-                    price = (quote.bid_price + quote.ask_price) / 2.0
-                    logger.debug("stock_price_fetched", symbol=symbol, price=price)
-                    return float(price)
-            
-            logger.warning("price_unavailable", symbol=symbol, is_crypto=is_crypto)
-            return None
-            
+                request = StockLatestQuoteRequest(symbol_or_symbols=symbols)
+                quotes = await asyncio.to_thread(self.data_client.get_stock_latest_quote, request)
         except Exception as e:
-            logger.error("price_fetch_failed", symbol=symbol, error=str(e))
-            logger.debug("cannot_fetch_price", symbol=symbol)
-            return None
+            logger.error("price_fetch_failed", symbols=symbols, is_crypto=is_crypto, error=str(e))
+            return {}
+        
+        prices = {}
+        for symbol in symbols:
+            quote = quotes.get(symbol)
+            if quote is None:
+                logger.warning("price_unavailable", symbol=symbol, is_crypto=is_crypto)
+                continue
+            # Use mid-point of bid/ask for better pricing
+            prices[symbol] = float((quote.bid_price + quote.ask_price) / 2.0)
+        # One line per batch rather than per symbol
+        logger.debug("crypto_prices_fetched" if is_crypto else "stock_prices_fetched", prices=prices)
+        return prices
 
     def round_to_tick(self, price: float, tick_size: float = None) -> float:
         """
@@ -161,19 +512,48 @@ class AlpacaClient:
         """
         if tick_size is None:
             # Auto-detect tick size based on price magnitude
-            if price < 0.01:  # Very small prices (like SHIB at $0.00001)
-                tick_size = 0.0000001  # 7 decimal places
-            elif price < 1.0:  # Small prices (like some altcoins)
-                tick_size = 0.0001  # 4 decimal places
-            elif price < 10.0:
-                tick_size = 0.01  # 2 decimal places
-            else:
-                tick_size = 0.01  # Standard 2 decimal places
+            index = bisect.bisect_right(_TICK_BOUNDS, price)
+            return _floor_to_inverse_tick(price, _TICK_TABLE[index][2])
+        
+        inverse = round(1 / tick_size)
+        if inverse >= 1 and math.isclose(inverse * tick_size, 1.0):
+            return _floor_to_inverse_tick(price, inverse)
         
         decimal_price = Decimal(str(price))
         decimal_tick = Decimal(str(tick_size))
         return float((decimal_price / decimal_tick).quantize(1, ROUND_DOWN) * decimal_tick)
 
+    def _is_crypto(self, symbol: str) -> bool:
+        """Memoized config.is_crypto_symbol."""
+        is_crypto = self._is_crypto_cache.get(symbol)
+        if is_crypto is None:
+            is_crypto = self._is_crypto_cache[symbol] = self.config.is_crypto_symbol(symbol)
+        return is_crypto
+
+    async def _submit_order(self, order_request):
+        """Submit an order, limiting how many requests are in flight at once."""
+        async with self._order_slots:
+            try:
+                return await asyncio.to_thread(self.trading_client.submit_order, order_request)
+            finally:
+                # Open orders and buying power both change on submission
+                self._open_orders_cache = None
+                self._account_cache = None
+
+    def _track_submitted(self, order) -> AlpacaOrder:
+        """
+        Wrap a just-submitted order and add it to tracked_orders.
+        
+        The trade stream can deliver the order's terminal update while the
+        submit call is still returning; that update was already handled as
+        untracked, so the order isn't tracked (nothing would ever remove it).
+        """
+        wrapper = AlpacaOrder(order)
+        handled = self._handled_states.get(order.id)
+        if handled is None or handled[0].value not in TERMINAL_STATUSES:
+            self.tracked_orders[order.id] = wrapper
+        return wrapper
+
     async def place_entry_with_trailing_stop(
         self, symbol: str, qty: int, last_price: float
     ) -> tuple[Optional[AlpacaOrder], Optional[AlpacaOrder]]:
@@ -196,10 +576,11 @@ class AlpacaClient:
         """
         try:
             # Detect if symbol is crypto
-            is_crypto = self.config.is_crypto_symbol(symbol)
+            is_crypto = self._is_crypto(symbol)
             
             # Calculate entry price
-            entry_pct = self.config.entries.buy_stop_pct_above_last
+            entries = self.config.entries
+            entry_pct = entries.buy_stop_pct_above_last
             entry_price = self.round_to_tick(last_price * (1 + entry_pct / 100))
             
             if is_crypto:
@@ -220,7 +601,7 @@ class AlpacaClient:
                 )
             else:
                 # Stocks: Use stop orders (standard)
-                if self.config.entries.type == "buy_stop":
+                if entries.type == "buy_stop":
                     order_request = StopOrderRequest(
                         symbol=symbol,
                         qty=qty,
@@ -229,7 +610,7 @@ class AlpacaClient:
                         stop_price=entry_price
                     )
                 else:  # buy_stop_limit
-                    slip_pct = self.config.entries.stop_limit_max_slip_pct
+                    slip_pct = entries.stop_limit_max_slip_pct
                     limit_price = self.round_to_tick(entry_price * (1 + slip_pct / 100))
                     order_request = StopLimitOrderRequest(
                         symbol=symbol,
@@ -241,11 +622,10 @@ class AlpacaClient:
                     )
             
             # Submit order
-            order = self.trading_client.submit_order(order_request)
-            parent_wrapper = AlpacaOrder(order)
+            order = await self._submit_order(order_request)
             
             # Track order for event handling
-            self.tracked_orders[order.id] = parent_wrapper
+            parent_wrapper = self._track_submitted(order)
             
             logger.info(
                 "entry_order_placed",
@@ -286,7 +666,7 @@ class AlpacaClient:
         """
         try:
             # Detect if symbol is crypto
-            is_crypto = self.config.is_crypto_symbol(symbol)
+            is_crypto = self._is_crypto(symbol)
             
             trail_percent = self.config.stops.trailing_stop_pct
             
@@ -324,11 +704,10 @@ class AlpacaClient:
                 )
             
             # Submit order
-            order = self.trading_client.submit_order(order_request)
-            wrapper = AlpacaOrder(order)
+            order = await self._submit_order(order_request)
             
             # Track order
-            self.tracked_orders[order.id] = wrapper
+            wrapper = self._track_submitted(order)
             
             logger.info(
                 "exit_order_placed",
@@ -360,11 +739,12 @@ class AlpacaClient:
         """
         try:
             order_id = order_wrapper.order.id
-            self.trading_client.cancel_order_by_id(order_id)
+            async with self._order_slots:
+                await asyncio.to_thread(self.trading_client.cancel_order_by_id, order_id)
             
             # Remove from tracking
-            if order_id in self.tracked_orders:
-                del self.tracked_orders[order_id]
+            self.tracked_orders.pop(order_id, None)
+            self._open_orders_cache = None
             
             logger.info("order_cancelled", order_id=order_id)
         except Exception as e:
@@ -374,34 +754,32 @@ class AlpacaClient:
         """
         Get all current positions.
         
+        Blocks on a cache miss; code on the event loop uses fetch_positions().
+        
         Returns:
             Dict of symbol -> position info
         """
+        cached = self._positions_cache
+        if cached is not None and time.monotonic() - cached[1] < self.config.cache.positions_ttl_seconds:
+            return dict(cached[0])
+        
         try:
             positions_list = self.trading_client.get_all_positions()
             positions = {}
             
             for position in positions_list:
-                # Safely get unrealized P&L (attribute may vary by account type)
-                unrealized_pnl = 0.0
-                try:
-                    if hasattr(position, 'unrealized_pl') and position.unrealized_pl is not None:
-                        unrealized_pnl = float(position.unrealized_pl)
-                    elif hasattr(position, 'unrealized_plpc') and position.unrealized_plpc is not None:
-                        market_val = float(position.market_value) if position.market_value is not None else 0.0
-                        unrealized_pnl = float(position.unrealized_plpc) * market_val
-                except (ValueError, TypeError) as e:
-                    logger.warning("unrealized_pnl_calculation_failed", symbol=position.symbol, error=str(e))
+                info = {key: _float_attr(position, attr) for key, attr in _POSITION_FIELDS}
                 
-                positions[position.symbol] = {
-                    "quantity": float(position.qty) if position.qty is not None else 0.0,
-                    "avg_cost": float(position.avg_entry_price) if position.avg_entry_price is not None else 0.0,
-                    "market_value": float(position.market_value) if position.market_value is not None else 0.0,
-                    "unrealized_pnl": unrealized_pnl,
-                    "current_price": float(position.current_price) if position.current_price is not None else 0.0,
-                }
+                # Unrealized P&L attribute may vary by account type
+                unrealized_pnl = _float_attr(position, 'unrealized_pl', None)
+                if unrealized_pnl is None:
+                    unrealized_pnl = _float_attr(position, 'unrealized_plpc') * info["market_value"]
+                info["unrealized_pnl"] = unrealized_pnl
+                
+                positions[position.symbol] = info
             
-            return positions
+            self._positions_cache = (positions, time.monotonic())
+            return dict(positions)
             
         except Exception as e:
             logger.error("positions_fetch_failed", error=str(e))
@@ -411,28 +789,92 @@ class AlpacaClient:
         """
         Get all open orders.
         
+        Blocks on a cache miss; code on the event loop uses fetch_open_orders().
+        
         Returns:
             List of AlpacaOrder wrappers
         """
+        cached = self._open_orders_cache
+        if cached is not None and time.monotonic() - cached[1] < self.config.cache.orders_ttl_seconds:
+            return list(cached[0])
+        
         try:
-            filter_request = GetOrdersRequest(
-                status=QueryOrderStatus.OPEN
-            )
-            orders = self.trading_client.get_orders(filter=filter_request)
-            
-            # Wrap orders
-            wrapped_orders = [AlpacaOrder(order) for order in orders]
-            
-            # Update tracking
-            for wrapper in wrapped_orders:
-                self.tracked_orders[wrapper.order.id] = wrapper
-            
-            return wrapped_orders
+            orders = self.trading_client.get_orders(filter=OPEN_ORDERS_REQUEST)
+            return self._store_open_orders(orders)
             
         except Exception as e:
             logger.error("open_orders_fetch_failed", error=str(e))
             return []
 
+    def _store_open_orders(self, orders) -> List[AlpacaOrder]:
+        """Wrap, track and cache a freshly fetched open orders list."""
+        # Wrap orders
+        wrapped_orders = [AlpacaOrder(order) for order in orders]
+        
+        # Update tracking
+        self.tracked_orders.update((wrapper.order.id, wrapper) for wrapper in wrapped_orders)
+        
+        self._open_orders_cache = (wrapped_orders, time.monotonic())
+        return list(wrapped_orders)
+
+    async def fetch_positions(self) -> Dict[str, dict]:
+        """get_positions() for event-loop callers; a cache miss is fetched in a worker thread."""
+        cached = self._positions_cache
+        if cached is not None and time.monotonic() - cached[1] < self.config.cache.positions_ttl_seconds:
+            return dict(cached[0])
+        return await asyncio.to_thread(self.get_positions)
+
+    async def fetch_open_orders(self) -> List[AlpacaOrder]:
+        """get_open_orders() for event-loop callers; a cache miss is fetched in a worker thread."""
+        cached = self._open_orders_cache
+        if cached is not None and time.monotonic() - cached[1] < self.config.cache.orders_ttl_seconds:
+            return list(cached[0])
+        try:
+            orders = await asyncio.to_thread(
+                self.trading_client.get_orders,
+                filter=OPEN_ORDERS_REQUEST,
+            )
+        except Exception as e:
+            logger.error("open_orders_fetch_failed", error=str(e))
+            return []
+        # Update tracked_orders back on the event loop thread
+        return self._store_open_orders(orders)
+
+    async def snapshot(self) -> tuple[Dict[str, dict], Optional[float], List[AlpacaOrder]]:
+        """
+        Fetch positions, account value and open orders concurrently.
+        
+        Each lands in its short-lived cache, so the per-symbol reads made
+        during the same tick are served without further requests.
+        
+        Returns:
+            (positions, account value, open orders)
+        """
+        return await asyncio.gather(
+            self.fetch_positions(),
+            asyncio.to_thread(self.get_account_value),
+            self.fetch_open_orders(),
+        )
+
+    def _get_account(self):
+        """
+        Fetch the Alpaca account, reusing it for cache.account_ttl_seconds.
+        
+        Callers may be worker threads; concurrent misses share one request.
+        """
+        ttl = self.config.cache.account_ttl_seconds
+        cached = self._account_cache
+        if cached is not None and time.monotonic() - cached[1] < ttl:
+            return cached[0]
+        with self._account_lock:
+            # Another thread may have fetched it while we waited
+            cached = self._account_cache
+            if cached is not None and time.monotonic() - cached[1] < ttl:
+                return cached[0]
+            account = self.trading_client.get_account()
+            self._account_cache = (account, time.monotonic())
+            return account
+
     def get_account_value(self) -> Optional[float]:
         """
         Get total account value.
@@ -441,8 +883,7 @@ class AlpacaClient:
             Account equity value or None
         """
         try:
-            account = self.trading_client.get_account()
-            return float(account.equity)
+            return float(self._get_account().equity)
         except Exception as e:
             logger.error("account_value_fetch_failed", error=str(e))
             return None
@@ -452,80 +893,138 @@ class AlpacaClient:
         Check for order updates and fills.
         This simulates event-driven updates for Alpaca's REST API.
         Called periodically by the bot.
+        
+        While the trade_updates stream is running, events are pushed to
+        _on_trade_update instead and this only runs a reconciliation poll
+        every STREAM_RECONCILE_SECONDS (catching anything missed while the
+        stream was reconnecting or the bot was down).
         """
+        now = time.monotonic()
+        if (
+            self._stream_running()
+            and self.last_order_check is not None
+            and now - self.last_order_check < STREAM_RECONCILE_SECONDS
+        ):
+            return
+        
+        # No open orders known (get_open_orders tracks every open order it
+        # sees), so there is nothing that could have closed. The first poll
+        # always runs to pick up fills from while the bot was down.
+        if not self.tracked_orders and self.last_order_check is not None:
+            return
+        
         try:
             # Get recent orders
-            orders = self.trading_client.get_orders(
-                filter=GetOrdersRequest(status=QueryOrderStatus.CLOSED, limit=50)
+            orders = await asyncio.to_thread(
+                self.trading_client.get_orders,
+                filter=CLOSED_ORDERS_REQUEST,
             )
+            self.last_order_check = now
             
             # Check all closed orders (not just tracked ones)
             for order in orders:
-                # Check if this is a tracked order with status change
-                if order.id in self.tracked_orders:
-                    old_wrapper = self.tracked_orders[order.id]
-                    old_status = old_wrapper.order.status
-                    
-                    # Order status changed
-                    if order.status != old_status:
-                        # Update wrapper
-                        new_wrapper = AlpacaOrder(order)
-                        self.tracked_orders[order.id] = new_wrapper
-                        
-                        # Trigger order status callback
-                        if self.on_order_status_callback:
-                            self.on_order_status_callback(new_wrapper)
-                        
-                        # If filled, trigger fill callback
-                        if order.status.value in ['filled', 'partially_filled']:
-                            if self.on_fill_callback:
-                                # Create a simple fill object
-                                fill = type('obj', (object,), {
-                                    'execution': type('obj', (object,), {
-                                        'shares': float(order.filled_qty),
-                                        'price': float(order.filled_avg_price) if order.filled_avg_price else 0,
-                                        'execId': order.id,
-                                    })()
-                                })()
-                                self.on_fill_callback(new_wrapper, fill)
-                        
-                        # Clean up filled/cancelled orders
-                        if order.status.value in ['filled', 'canceled', 'expired', 'rejected']:
-                            del self.tracked_orders[order.id]
-                
-                # Also process filled orders that weren't tracked (e.g., from before restart)
-                elif order.status.value in ['filled', 'partially_filled'] and order.filled_qty:
-                    # Check if we've already recorded this fill in the database
-                    # to avoid duplicate processing
-                    wrapper = AlpacaOrder(order)
-                    
-                    # Trigger callbacks for untracked fills
-                    if self.on_order_status_callback:
-                        self.on_order_status_callback(wrapper)
-                    
-                    if self.on_fill_callback:
-                        # Create a simple fill object
-                        fill = type('obj', (object,), {
-                            'execution': type('obj', (object,), {
-                                'shares': float(order.filled_qty),
-                                'price': float(order.filled_avg_price) if order.filled_avg_price else 0,
-                                'execId': order.id,
-                            })()
-                        })()
-                        self.on_fill_callback(wrapper, fill)
-                    
-                    logger.info(
-                        "untracked_fill_detected",
-                        symbol=order.symbol,
-                        order_id=str(order.id),
-                        status=order.status.value,
-                        qty=order.filled_qty,
-                        price=order.filled_avg_price
-                    )
+                self._handle_order_update(order)
             
         except Exception as e:
             logger.error("event_check_failed", error=str(e))
 
+    async def _on_trade_update(self, data):
+        """Handle a trade_updates stream message (same dispatch as polling)."""
+        try:
+            self._handle_order_update(data.order)
+        except Exception as e:
+            logger.error("trade_update_failed", event=str(data.event), error=str(e))
+
+    def _stream_running(self) -> bool:
+        """Whether the trade_updates stream task is alive."""
+        return self._stream_task is not None and not self._stream_task.done()
+
+    def _handle_order_update(self, order):
+        """
+        Dispatch callbacks for an order whose latest state was just observed.
+        
+        Tracked orders fire callbacks when their status changes; untracked
+        filled orders (e.g. from before a restart) fire them unconditionally
+        and rely on the fill callback's exec_id de-duplication.
+        
+        Updates repeating an already-handled (status, filled_qty) are skipped.
+        """
+        state = (order.status, order.filled_qty)
+        if self._handled_states.get(order.id) == state:
+            return
+        self._handled_states[order.id] = state
+        self._open_orders_cache = None
+        
+        # Check if this is a tracked order with status change
+        if order.id in self.tracked_orders:
+            old_wrapper = self.tracked_orders[order.id]
+            old_status = old_wrapper.order.status
+            
+            # Order status changed
+            if order.status != old_status:
+                # Update wrapper
+                new_wrapper = AlpacaOrder(order)
+                self.tracked_orders[order.id] = new_wrapper
+                
+                # Trigger order status callback
+                if self.on_order_status_callback:
+                    self.on_order_status_callback(new_wrapper)
+                
+                # If filled, trigger fill callback
+                if order.status.value == FILLED_STATUS:
+                    self.invalidate_account_caches()
+                    if self.on_fill_callback:
+                        self.on_fill_callback(new_wrapper, self._order_fill(order))
+                
+                # Clean up filled/cancelled orders
+                if order.status.value in TERMINAL_STATUSES:
+                    del self.tracked_orders[order.id]
+        
+        # Also process filled orders that weren't tracked (e.g., from before restart)
+        elif order.status.value == FILLED_STATUS and order.filled_qty:
+            # Check if we've already recorded this fill in the database
+            # to avoid duplicate processing
+            wrapper = AlpacaOrder(order)
+            self.invalidate_account_caches()
+            
+            # Trigger callbacks for untracked fills
+            if self.on_order_status_callback:
+                self.on_order_status_callback(wrapper)
+            
+            if self.on_fill_callback:
+                self.on_fill_callback(wrapper, self._order_fill(order))
+            
+            logger.info(
+                "untracked_fill_detected",
+                symbol=order.symbol,
+                order_id=str(order.id),
+                status=order.status.value,
+                qty=order.filled_qty,
+                price=order.filled_avg_price
+            )
+
+    @staticmethod
+    def _order_fill(order):
+        """
+        Build the fill object passed to the fill callback.
+        
+        Only called once the order is fully filled, so the quantity is the
+        order's total. The order id is the exec id whether the update came
+        from polling or the stream, so fills de-duplicate the same way on
+        both paths.
+        """
+        return Fill(Execution(
+            shares=float(order.filled_qty),
+            price=float(order.filled_avg_price) if order.filled_avg_price else 0,
+            execId=order.id,
+        ))
+
+    def invalidate_account_caches(self):
+        """Drop cached positions, account value and open orders (e.g. after a fill)."""
+        self._positions_cache = None
+        self._account_cache = None
+        self._open_orders_cache = None
+
     def register_fill_callback(self, callback: Callable):
         """Register callback for fill events."""
         self.on_fill_callback = callback
@@ -539,9 +1038,10 @@ class AlpacaClient:
         Keep-alive tickle (not needed for Alpaca REST API, but kept for compatibility).
         """
         try:
-            # Just verify connection with a lightweight request
-            account = self.trading_client.get_account()
-            logger.debug("keepalive_ping", account_status=account.status.value)
+            # Just verify connection with a lightweight request (the market
+            # clock is a far smaller payload than the account)
+            clock = await asyncio.to_thread(self.trading_client.get_clock)
+            logger.debug("keepalive_ping", market_open=clock.is_open)
         except Exception as e:
             logger.warning("keepalive_failed", error=str(e))
 
@@ -553,35 +1053,16 @@ class AlpacaClient:
             Dict with account metrics
         """
         try:
-            account = self.trading_client.get_account()
+            account = self._get_account()
             
-            # Safely get unrealized P&L (attribute may vary by account type)
-            unrealized_pnl = 0.0
-            if hasattr(account, 'unrealized_pl'):
-                unrealized_pnl = float(account.unrealized_pl)
-            elif hasattr(account, 'unrealized_plpc'):
-                unrealized_pnl = float(account.unrealized_plpc)
+            summary = {key: _float_attr(account, attr) for key, attr in _ACCOUNT_FIELDS}
             
-            # Safely calculate realized P&L
-            realized_pnl = 0.0
-            if hasattr(account, 'equity') and hasattr(account, 'last_equity'):
-                try:
-                    equity = float(account.equity) if account.equity is not None else 0.0
-                    last_equity = float(account.last_equity) if account.last_equity is not None else 0.0
-                    realized_pnl = equity - last_equity
-                except (ValueError, TypeError) as e:
-                    logger.warning("realized_pnl_calculation_failed", error=str(e))
-                    realized_pnl = 0.0
-            
-            summary = {
-                'NetLiquidation': float(account.equity) if hasattr(account, 'equity') and account.equity is not None else 0.0,
-                'TotalCashValue': float(account.cash) if hasattr(account, 'cash') and account.cash is not None else 0.0,
-                'GrossPositionValue': float(account.long_market_value) if hasattr(account, 'long_market_value') and account.long_market_value is not None else 0.0,
-                'UnrealizedPnL': unrealized_pnl,
-                'RealizedPnL': realized_pnl,
-                'AvailableFunds': float(account.cash) if hasattr(account, 'cash') and account.cash is not None else 0.0,
-                'BuyingPower': float(account.buying_power) if hasattr(account, 'buying_power') and account.buying_power is not None else 0.0,
-            }
+            # Unrealized P&L attribute may vary by account type
+            unrealized_pnl = _float_attr(account, 'unrealized_pl', None)
+            if unrealized_pnl is None:
+                unrealized_pnl = _float_attr(account, 'unrealized_plpc')
+            summary['UnrealizedPnL'] = unrealized_pnl
+            summary['RealizedPnL'] = summary['NetLiquidation'] - _float_attr(account, 'last_equity')
             
             logger.info("account_summary_fetched", summary=summary)
             return summary
@@ -600,6 +1081,7 @@ class AlpacaClient:
         """
         try:
             self.trading_client.close_all_positions(cancel_orders=True)
+            self.invalidate_account_caches()
             logger.info("closed_all_positions")
             return True
         except Exception as e:
@@ -615,6 +1097,7 @@ class AlpacaClient:
         """
         try:
             self.trading_client.cancel_orders()
+            self._open_orders_cache = None
             logger.info("cancelled_all_orders")
             return True
         except Exception as e:
@@ -632,6 +1115,8 @@ class AlpacaClient:
         try:
             # Close all positions (which also cancels orders)
             result = self.close_all_positions()
+            # Nothing read before the reset may be served afterwards
+            self.invalidate_account_caches()
             
             if result:
                 logger.info("paper_account_reset", 
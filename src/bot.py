@@ -6,11 +6,12 @@ from typing import Dict, Optional
 import signal
 import sys
 import structlog
+from cachetools import LRUCache
 
 from alpaca.trading.enums import OrderType
 
 from src.config import BotConfig
-from src.database import DatabaseManager
+from src.database import DatabaseManager, FillRecord
 from src.alpaca_client import AlpacaClient, AlpacaOrder
 from src.market_hours import MarketHoursChecker
 from src.sizing import PositionSizer
@@ -19,6 +20,15 @@ from src.performance import PerformanceTracker
 
 logger = structlog.get_logger()
 
+# Fill/order-status audit events are written in batches of up to this many,
+# collected over at most this long
+EVENT_BATCH_MAX = 256
+EVENT_BATCH_WINDOW_SECONDS = 0.05
+EVENT_QUEUE_MAX = 10_000
+
+# Recently recorded exec_ids remembered to skip the DB check on repeats
+SEEN_EXEC_IDS_MAX = 4096
+
 
 class TradingBot:
     """Main trading bot orchestrator."""
@@ -43,6 +53,8 @@ class TradingBot:
         # State machines for each symbol (stocks + crypto)
         self.state_machines: Dict[str, SymbolStateMachine] = {}
         all_symbols = config.get_all_symbols()
+        self.crypto_symbols = frozenset(s for s in all_symbols if config.is_crypto_symbol(s))
+        self.stock_symbols = [s for s in all_symbols if s not in self.crypto_symbols]
         for symbol in all_symbols:
             self.state_machines[symbol] = SymbolStateMachine(
                 symbol, config, self.alpaca, self.db, self.sizer
@@ -52,18 +64,26 @@ class TradingBot:
         self.performance = PerformanceTracker(self.db, self.alpaca)
         
         # Register event handlers
+        self.alpaca.register_watched_symbols(all_symbols)
         self.alpaca.register_fill_callback(self._on_fill)
         self.alpaca.register_order_status_callback(self._on_order_status)
         
-        # Track last event check time
-        self.last_event_check = datetime.min
+        # Order placements spawned from callbacks, awaited on shutdown
+        self._background_tasks: set = set()
+        
+        # Set by order callbacks to run the next trading tick right away
+        self._wake = asyncio.Event()
+        
+        # exec_ids known to be in the fills table
+        self._seen_exec_ids: LRUCache = LRUCache(maxsize=SEEN_EXEC_IDS_MAX)
         
-        # Track last operation times
-        self.last_price_check = datetime.min
-        self.last_order_check = datetime.min
+        # Audit events queued from order callbacks, written by _event_writer
+        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAX)
+        self._event_writer_task: Optional[asyncio.Task] = None
+        
+        # Track last once-a-day operations
         self.last_eod_cancel = None
         self.last_snapshot_date = None
-        self.last_keepalive = datetime.min
         
         logger.info(
             "trading_bot_initialized",
@@ -80,8 +100,18 @@ class TradingBot:
         logger.info("starting_trading_bot")
         
         # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        loop = asyncio.get_running_loop()
+        loop_signals = []
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._request_stop, signum)
+                loop_signals.append(signum)
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler
+                signal.signal(
+                    signum,
+                    lambda sig, frame: loop.call_soon_threadsafe(self._request_stop, sig),
+                )
         
         # Connect to Alpaca
         await self.alpaca.connect()
@@ -108,12 +138,18 @@ class TradingBot:
             raise
         finally:
             await self.stop()
+            for signum in loop_signals:
+                loop.remove_signal_handler(signum)
 
     async def stop(self):
         """Stop the trading bot."""
         logger.info("stopping_trading_bot")
         self.running = False
         
+        # Let in-flight order placements (e.g. trailing stops) finish first
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        
         await self.alpaca.disconnect()
         
         with self.db.get_session() as session:
@@ -121,15 +157,114 @@ class TradingBot:
         
         logger.info("trading_bot_stopped")
 
-    def _signal_handler(self, signum, frame):
-        """Handle shutdown signals."""
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run coro in the background, keeping a reference and logging failures."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_task_done)
+        return task
+
+    def _background_task_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("background_task_failed", error=str(task.exception()), exc_info=task.exception())
+
+    def _request_stop(self, signum):
+        """Handle shutdown signals, waking the main loop so it exits promptly."""
         logger.info("shutdown_signal_received", signal=signum)
         self.running = False
+        self._wake.set()
 
     async def _run_loop(self):
         """Main event loop."""
         logger.info("entering_main_loop")
         
+        # Order event checks and keep-alives run on their own cadences,
+        # independent of the trading tick and of market hours
+        periodic_tasks = [
+            asyncio.create_task(self._periodic(
+                "order_events", self.config.polling.event_check_seconds, self.alpaca.check_for_events
+            )),
+            asyncio.create_task(self._periodic(
+                "keepalive", self.config.polling.keepalive_seconds, self.alpaca.keep_alive
+            )),
+        ]
+        self._event_writer_task = asyncio.create_task(self._event_writer())
+        try:
+            await self._trading_loop()
+        finally:
+            for task in periodic_tasks:
+                task.cancel()
+            await asyncio.gather(*periodic_tasks, return_exceptions=True)
+            
+            # Flush queued events before shutdown is recorded
+            writer, self._event_writer_task = self._event_writer_task, None
+            await self._event_queue.put(None)
+            await asyncio.gather(writer, return_exceptions=True)
+        
+        logger.info("exiting_main_loop")
+
+    async def _periodic(self, name: str, interval: float, func):
+        """Await func() every interval seconds (monotonic) while the bot runs."""
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while self.running:
+            try:
+                await func()
+            except Exception as e:
+                logger.error("periodic_task_error", task=name, error=str(e), exc_info=True)
+            next_at += interval
+            # Skip missed runs rather than firing them back-to-back
+            next_at = max(next_at, loop.time())
+            await asyncio.sleep(next_at - loop.time())
+
+    def _record_event(self, event_type: str, symbol: Optional[str] = None, payload: Optional[dict] = None):
+        """Queue an audit event for the batch writer (written directly if it isn't running)."""
+        event = {"event_type": event_type, "symbol": symbol, "payload": payload, "ts": datetime.utcnow()}
+        if self._event_writer_task is not None:
+            try:
+                self._event_queue.put_nowait(event)
+                return
+            except asyncio.QueueFull:
+                logger.warning("event_queue_full", event_type=event_type)
+        self._write_events([event])
+
+    def _write_events(self, events: list):
+        """Write a batch of queued events in one transaction."""
+        try:
+            with self.db.get_session() as session:
+                self.db.add_events(session, events)
+        except Exception as e:
+            logger.error("event_write_failed", count=len(events), error=str(e))
+
+    async def _event_writer(self):
+        """Drain the event queue in batches until a None sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._event_queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            deadline = loop.time() + EVENT_BATCH_WINDOW_SECONDS
+            while len(batch) < EVENT_BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._event_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if event is None:
+                    stop = True
+                    break
+                batch.append(event)
+            self._write_events(batch)
+            if stop:
+                return
+
+    async def _trading_loop(self):
+        """Trading tick: prices, entries/exits, EOD cancels, daily snapshot."""
         while self.running:
             try:
                 # Check if we're in trading hours (for stocks)
@@ -141,9 +276,7 @@ class TradingBot:
                     await self._process_trading_logic(in_rth=in_rth)
                 else:
                     logger.debug("outside_trading_hours_no_crypto")
-                    # Keep connection alive even when market is closed
-                    await self._keepalive_tick()
-                    await asyncio.sleep(60)  # Check every minute when market is closed
+                    await self._sleep_until_woken(60)  # Check every minute when market is closed
                     continue
                 
                 # Handle end-of-day cancellations
@@ -152,20 +285,20 @@ class TradingBot:
                 # Take daily performance snapshot
                 await self._take_daily_snapshot()
                 
-                # Check for order events (Alpaca REST polling)
-                await self._check_order_events()
-                
-                # Keep-alive ping to prevent connection timeout
-                await self._keepalive_tick()
-                
-                # Sleep based on polling interval
-                await asyncio.sleep(self.config.polling.orders_seconds)
+                # Sleep based on polling interval, or until an order event
+                await self._sleep_until_woken(self.config.polling.orders_seconds)
                 
             except Exception as e:
                 logger.error("loop_iteration_error", error=str(e), exc_info=True)
                 await asyncio.sleep(10)  # Brief pause on error
-        
-        logger.info("exiting_main_loop")
+
+    async def _sleep_until_woken(self, timeout: float):
+        """Sleep for timeout seconds, returning early if an order callback sets _wake."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
 
     async def _process_trading_logic(self, in_rth: bool = True):
         """Process trading logic for all symbols.
@@ -173,9 +306,9 @@ class TradingBot:
         Args:
             in_rth: Whether we're in regular trading hours (affects stock trading)
         """
-        # Get current positions and account value
-        positions = self.alpaca.get_positions()
-        account_value = self.alpaca.get_account_value()
+        # Get current positions and account value (open orders are fetched
+        # alongside so the state machines' status checks hit the cache)
+        positions, account_value, _ = await self.alpaca.snapshot()
         
         # Calculate current exposures
         position_values = {
@@ -186,16 +319,22 @@ class TradingBot:
         exposure_metrics = self.sizer.get_current_exposure(position_values)
         logger.debug("exposure_metrics", **exposure_metrics)
         
-        # Process each symbol
-        for symbol, sm in self.state_machines.items():
+        # Skip stocks if market is closed
+        if in_rth:
+            active_symbols = list(self.state_machines)
+        else:
+            active_symbols = [s for s in self.state_machines if s in self.crypto_symbols]
+            logger.debug("skipping_stocks_outside_rth", symbols=self.stock_symbols)
+        
+        # Price every symbol for this tick together (one request per asset class)
+        last_prices = await self.alpaca.get_last_prices(active_symbols) if active_symbols else {}
+        
+        # Process symbols concurrently so their order submissions overlap
+        # (AlpacaClient caps how many are in flight)
+        async def process_symbol(symbol):
+            sm = self.state_machines[symbol]
             try:
-                # Skip stocks if market is closed
-                is_crypto = self.config.is_crypto_symbol(symbol)
-                if not is_crypto and not in_rth:
-                    logger.debug("skipping_stock_outside_rth", symbol=symbol)
-                    continue
-                
-                await sm.process(position_values, account_value)
+                await sm.process(position_values, account_value, last_prices.get(symbol))
             except Exception as e:
                 logger.error(
                     "symbol_processing_error",
@@ -203,6 +342,8 @@ class TradingBot:
                     error=str(e),
                     exc_info=True,
                 )
+        
+        await asyncio.gather(*(process_symbol(symbol) for symbol in active_symbols))
 
     async def _handle_eod_cancellations(self):
         """Handle end-of-day order cancellations (stocks only, not crypto)."""
@@ -218,10 +359,15 @@ class TradingBot:
             if self.last_eod_cancel != today:
                 logger.info("cancelling_unfilled_stock_entries_eod")
                 
-                # Only cancel stock orders, not crypto (crypto trades 24/7)
-                for symbol, sm in self.state_machines.items():
-                    if not self.config.is_crypto_symbol(symbol):
-                        await sm.cancel_unfilled_entries()
+                # Only cancel stock orders, not crypto (crypto trades 24/7).
+                # Symbols are independent, so their cancellations overlap.
+                results = await asyncio.gather(
+                    *(self.state_machines[s].cancel_unfilled_entries() for s in self.stock_symbols),
+                    return_exceptions=True,
+                )
+                for symbol, result in zip(self.stock_symbols, results):
+                    if isinstance(result, Exception):
+                        logger.error("eod_cancellation_error", symbol=symbol, error=str(result))
                 
                 self.last_eod_cancel = today
                 
@@ -231,26 +377,6 @@ class TradingBot:
                         event_type="eod_stock_cancellations_completed",
                     )
 
-    async def _check_order_events(self):
-        """Check for order updates and fills (Alpaca REST polling)."""
-        now = datetime.utcnow()
-        
-        # Check for events based on configured interval
-        interval = self.config.polling.event_check_seconds
-        if (now - self.last_event_check).total_seconds() >= interval:
-            await self.alpaca.check_for_events()
-            self.last_event_check = now
-
-    async def _keepalive_tick(self):
-        """Send periodic keep-alive to Alpaca to prevent timeout."""
-        now = datetime.utcnow()
-        
-        # Send keep-alive based on configured interval
-        interval = self.config.polling.keepalive_seconds
-        if (now - self.last_keepalive).total_seconds() >= interval:
-            await self.alpaca.keep_alive()
-            self.last_keepalive = now
-
     async def _take_daily_snapshot(self):
         """Take daily performance snapshot."""
         today = datetime.utcnow().date()
@@ -260,16 +386,17 @@ class TradingBot:
             return
         
         try:
-            # Get account summary
-            account_summary = self.performance.get_account_summary()
-            positions = self.alpaca.get_positions()
+            # Get account summary (blocking SDK calls, kept off the event loop)
+            account_summary, positions = await asyncio.gather(
+                asyncio.to_thread(self.performance.get_account_summary),
+                self.alpaca.fetch_positions(),
+            )
             
             if not account_summary:
                 return
             
             with self.db.get_session() as session:
                 # Get trade count for today
-                from src.database import FillRecord
                 today_start = datetime.combine(today, datetime.min.time())
                 trades_today = (
                     session.query(FillRecord)
@@ -300,17 +427,25 @@ class TradingBot:
         """Handle fill events."""
         symbol = order_wrapper.contract.symbol
         exec_id = str(fill.execution.execId)  # Convert to string for consistency
+        qty = fill.execution.shares
+        price = fill.execution.price
         
         order = order_wrapper.order
         side = order.side.value.upper()
         order_id = str(order.id)  # Convert UUID to string
         
+        # Repeat of a fill already recorded (polling and the trade stream
+        # can both report it)
+        if exec_id in self._seen_exec_ids:
+            logger.debug("fill_already_processed", exec_id=exec_id, symbol=symbol)
+            return
+        
         logger.info(
             "fill_received",
             symbol=symbol,
             side=side,
-            qty=fill.execution.shares,
-            price=fill.execution.price,
+            qty=qty,
+            price=price,
             order_id=order_id,
             exec_id=exec_id,
         )
@@ -319,6 +454,7 @@ class TradingBot:
         with self.db.get_session() as session:
             # Check if fill already exists before processing
             if self.db.fill_exists(session, exec_id):
+                self._seen_exec_ids[exec_id] = True
                 logger.debug("fill_already_processed", exec_id=exec_id, symbol=symbol)
                 return
             
@@ -327,23 +463,26 @@ class TradingBot:
                 exec_id=exec_id,
                 symbol=symbol,
                 side=side,
-                qty=fill.execution.shares,
-                price=fill.execution.price,
+                qty=qty,
+                price=price,
                 order_id=order_id,
             )
-            
-            self.db.add_event(
-                session,
-                event_type="fill",
-                symbol=symbol,
-                payload={
-                    "exec_id": exec_id,
-                    "side": side,
-                    "qty": fill.execution.shares,
-                    "price": fill.execution.price,
-                    "order_id": order_id,
-                },
-            )
+        self._seen_exec_ids[exec_id] = True
+        self._wake.set()
+        
+        # The fill row above is written immediately since it de-duplicates
+        # repeat callbacks; its audit event can ride the batch writer
+        self._record_event(
+            "fill",
+            symbol,
+            {
+                "exec_id": exec_id,
+                "side": side,
+                "qty": qty,
+                "price": price,
+                "order_id": order_id,
+            },
+        )
         
         # If this is a SELL fill of a trailing stop, enter cooldown
         if side == "SELL" and order.type == OrderType.TRAILING_STOP:
@@ -353,10 +492,7 @@ class TradingBot:
         
         # If this is a BUY fill, place trailing stop
         if side == "BUY" and symbol in self.state_machines:
-            asyncio.create_task(self.state_machines[symbol].place_trailing_stop_after_entry(
-                int(fill.execution.shares),
-                fill.execution.price
-            ))
+            self._spawn(self.state_machines[symbol].place_trailing_stop_after_entry(int(qty), price))
 
     def _on_order_status(self, order_wrapper: AlpacaOrder):
         """Handle order status updates."""
@@ -374,18 +510,19 @@ class TradingBot:
         # Update order status in database
         with self.db.get_session() as session:
             self.db.update_order_status(session, order_id, status)
-            
-            # Log significant status changes
-            if status in ["filled", "canceled", "cancelled", "expired", "rejected"]:
-                self.db.add_event(
-                    session,
-                    event_type=f"order_{status}",
-                    symbol=symbol,
-                    payload={
-                        "order_id": order_id,
-                        "status": status,
-                    },
-                )
+        
+        # Log significant status changes
+        if status in {"filled", "canceled", "cancelled", "expired", "rejected"}:
+            # A symbol may be free to re-arm; don't wait out the poll interval
+            self._wake.set()
+            self._record_event(
+                f"order_{status}",
+                symbol,
+                {
+                    "order_id": order_id,
+                    "status": status,
+                },
+            )
 
 
 async def main(config_path: str = "config.yaml"):
@@ -60,6 +60,22 @@ class PollingConfig(BaseModel):
     orders_seconds: int = 15
     keepalive_seconds: int = 300  # Keep connection alive (5 minutes default)
     event_check_seconds: int = 5  # Check for order updates/fills (Alpaca REST polling)
+    use_trade_stream: bool = True  # Push order updates over websocket; polling becomes a fallback
+
+
+class CacheConfig(BaseModel):
+    """How long broker reads are reused before asking Alpaca again."""
+    price_ttl_seconds: float = 0.5
+    positions_ttl_seconds: float = 2.0
+    account_ttl_seconds: float = 5.0
+    orders_ttl_seconds: float = 2.0
+    price_refresh_seconds: float = 0.0  # Refetch watchlist prices in the background (0 = off)
+
+
+class RateLimitConfig(BaseModel):
+    """Client-side request throttle, per Alpaca API host."""
+    requests_per_minute: int = 190  # Alpaca allows 200/min per API
+    burst: int = 10
 
 
 class RiskConfig(BaseModel):
@@ -95,6 +111,8 @@ class BotConfig(BaseModel):
     hours: HoursConfig = Field(default_factory=HoursConfig)
     cooldowns: CooldownsConfig = Field(default_factory=CooldownsConfig)
     polling: PollingConfig = Field(default_factory=PollingConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
     risk: RiskConfig = Field(default_factory=RiskConfig)
     persistence: PersistenceConfig = Field(default_factory=PersistenceConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
@@ -4,15 +4,21 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, JSON, Boolean
+from sqlalchemy import (
+    create_engine, event, func, insert, literal_column, select,
+    Column, Index, Integer, String, Float, DateTime, JSON, Boolean,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
+from sqlalchemy.pool import QueuePool, StaticPool
 import structlog
 
 Base = declarative_base()
 logger = structlog.get_logger()
 
+# Order statuses that count as still working at the broker
+ACTIVE_ORDER_STATUSES = ["Submitted", "PreSubmitted", "PendingSubmit"]
+
 
 class SymbolState(Base):
     """Track per-symbol state including cooldowns."""
@@ -28,6 +34,10 @@ class SymbolState(Base):
 class OrderRecord(Base):
     """Track all orders placed by the bot."""
     __tablename__ = "orders"
+    __table_args__ = (
+        # Serves status filters ordered by recency (SQLite scans it backwards for DESC)
+        Index("ix_orders_status_created", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     order_id = Column(String, unique=True, index=True)  # Changed to String for UUID support
@@ -60,6 +70,10 @@ class FillRecord(Base):
 class EventRecord(Base):
     """Generic event log for auditing."""
     __tablename__ = "events"
+    __table_args__ = (
+        # Serves "latest event of type X" lookups
+        Index("ix_events_type_ts", "event_type", "ts"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     symbol = Column(String, index=True, nullable=True)
@@ -85,6 +99,15 @@ class PerformanceSnapshot(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL journaling and a larger page cache on new SQLite connections."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.close()
+
+
 class DatabaseManager:
     """Manage database connections and operations."""
 
@@ -92,13 +115,25 @@ class DatabaseManager:
         """Initialize database manager."""
         self.db_url = db_url
         
-        # Use StaticPool for SQLite to avoid threading issues
-        if db_url.startswith("sqlite"):
+        if db_url.startswith("sqlite") and ":memory:" in db_url:
+            # In-memory databases only exist per connection, so share one
             self.engine = create_engine(
                 db_url,
                 connect_args={"check_same_thread": False},
                 poolclass=StaticPool,
             )
+        elif db_url.startswith("sqlite"):
+            # File-backed SQLite: pool connections across threads and use WAL
+            # so API readers don't block on (or get blocked by) bot writes
+            self.engine = create_engine(
+                db_url,
+                connect_args={"check_same_thread": False},
+                poolclass=QueuePool,
+                pool_size=5,
+                max_overflow=10,
+                pool_pre_ping=True,
+            )
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         else:
             self.engine = create_engine(db_url)
         
@@ -108,11 +143,19 @@ class DatabaseManager:
             bind=self.engine
         )
         
+        # Thread-local sessions for request handlers; call scoped_session.remove()
+        # when the request ends
+        self.scoped_session = scoped_session(self.SessionLocal)
+        
         logger.info("database_manager_initialized", db_url=db_url)
 
     def create_tables(self):
-        """Create all tables."""
+        """Create all tables, plus any indexes missing from older databases."""
         Base.metadata.create_all(bind=self.engine)
+        # create_all skips existing tables entirely, including new indexes
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
         logger.info("database_tables_created")
 
     def get_session(self) -> Session:
@@ -170,6 +213,25 @@ class DatabaseManager:
         session.commit()
         return fill
 
+    def count_fills(self, session: Session) -> int:
+        """
+        Get the total number of fill records.
+        
+        Fills are append-only, so on SQLite the largest rowid equals the row
+        count and can be read from the b-tree without a full table scan.
+        """
+        return session.execute(select(self._fill_count_subquery())).scalar() or 0
+
+    def _fill_count_subquery(self):
+        """Scalar subquery yielding the number of fill records."""
+        if self.engine.dialect.name == "sqlite":
+            return (
+                select(func.coalesce(func.max(literal_column("rowid")), 0))
+                .select_from(FillRecord.__table__)
+                .scalar_subquery()
+            )
+        return select(func.count()).select_from(FillRecord.__table__).scalar_subquery()
+
     def add_event(self, session: Session, event_type: str, symbol: Optional[str] = None, 
                   payload: Optional[dict] = None) -> EventRecord:
         """Add an event record."""
@@ -182,6 +244,33 @@ class DatabaseManager:
         session.commit()
         return event
 
+    def add_events(self, session: Session, events: list[dict]) -> int:
+        """
+        Add several event records in one executemany and one commit.
+        
+        Args:
+            events: Dicts with event_type and optional symbol, payload and ts
+                (defaults to now)
+        
+        Returns:
+            Number of events written
+        """
+        if not events:
+            return 0
+        now = datetime.utcnow()
+        rows = [
+            {
+                "symbol": e["symbol"].upper() if e.get("symbol") else None,
+                "event_type": e["event_type"],
+                "payload_json": e.get("payload"),
+                "ts": e.get("ts") or now,
+            }
+            for e in events
+        ]
+        session.execute(insert(EventRecord), rows)
+        session.commit()
+        return len(rows)
+
     def get_recent_fills(self, session: Session, symbol: str, limit: int = 10) -> list[FillRecord]:
         """Get recent fills for a symbol."""
         return (
@@ -195,12 +284,44 @@ class DatabaseManager:
     def get_active_orders(self, session: Session, symbol: Optional[str] = None) -> list[OrderRecord]:
         """Get active orders (not filled/cancelled)."""
         query = session.query(OrderRecord).filter(
-            OrderRecord.status.in_(["Submitted", "PreSubmitted", "PendingSubmit"])
+            OrderRecord.status.in_(ACTIVE_ORDER_STATUSES)
         )
         if symbol:
             query = query.filter(OrderRecord.symbol == symbol.upper())
         return query.all()
 
+    def get_status_summary(self, session: Session) -> dict:
+        """
+        Get bot-wide status counters and latest events in a single query.
+        
+        Returns:
+            Dict with active_orders, total_fills, last_event_type,
+            last_event_symbol, last_event_ts and bot_started_ts
+        """
+        def latest_event(column, *criteria):
+            query = select(column).order_by(EventRecord.ts.desc(), EventRecord.id.desc())
+            if criteria:
+                query = query.where(*criteria)
+            return query.limit(1).scalar_subquery()
+
+        row = session.execute(
+            select(
+                select(func.count())
+                .select_from(OrderRecord.__table__)
+                .where(OrderRecord.status.in_(ACTIVE_ORDER_STATUSES))
+                .scalar_subquery()
+                .label("active_orders"),
+                self._fill_count_subquery().label("total_fills"),
+                latest_event(EventRecord.event_type).label("last_event_type"),
+                latest_event(EventRecord.symbol).label("last_event_symbol"),
+                latest_event(EventRecord.ts).label("last_event_ts"),
+                latest_event(
+                    EventRecord.ts, EventRecord.event_type == "bot_started"
+                ).label("bot_started_ts"),
+            )
+        ).one()
+        return dict(row._mapping)
+
     def add_performance_snapshot(self, session: Session, **kwargs) -> PerformanceSnapshot:
         """Add a performance snapshot."""
         snapshot = PerformanceSnapshot(**kwargs)
@@ -1,7 +1,7 @@
 """Market hours checking utilities using pandas_market_calendars."""
 
-from datetime import datetime, time, timedelta
-from typing import Optional
+from datetime import date as Date, datetime, time, timedelta
+from typing import Dict, Optional
 import pandas_market_calendars as mcal
 import pytz
 import structlog
@@ -41,6 +41,21 @@ class MarketHoursChecker:
         self.after_hours_close = time(20, 0)
 
         self.eastern = pytz.timezone("America/New_York")
+        
+        # Trading-day lookups per date; the calendar never changes at runtime
+        self._trading_days: Dict[Date, bool] = {}
+
+    def is_trading_day(self, date: Date) -> bool:
+        """
+        Check whether the exchange has a session on the given (Eastern) date.
+        
+        Schedule lookups build a pandas frame, so results are memoized.
+        """
+        is_trading = self._trading_days.get(date)
+        if is_trading is None:
+            schedule = self.calendar.schedule(start_date=date, end_date=date)
+            is_trading = self._trading_days[date] = not schedule.empty
+        return is_trading
 
     def is_market_open(self, dt: Optional[datetime] = None) -> bool:
         """
@@ -62,9 +77,7 @@ class MarketHoursChecker:
         
         # Check if it's a trading day
         date = dt_eastern.date()
-        schedule = self.calendar.schedule(start_date=date, end_date=date)
-        
-        if schedule.empty:
+        if not self.is_trading_day(date):
             logger.debug("market_closed_not_trading_day", date=str(date))
             return False
         
@@ -112,9 +125,7 @@ class MarketHoursChecker:
         
         # Check if it's a trading day
         date = dt_eastern.date()
-        schedule = self.calendar.schedule(start_date=date, end_date=date)
-        
-        if schedule.empty:
+        if not self.is_trading_day(date):
             return False
         
         # Check RTH hours
@@ -143,9 +154,7 @@ class MarketHoursChecker:
         # Look ahead up to 10 days
         for i in range(10):
             check_date = date + timedelta(days=i)
-            schedule = self.calendar.schedule(start_date=check_date, end_date=check_date)
-            
-            if not schedule.empty:
+            if self.is_trading_day(check_date):
                 # Market opens at 9:30 AM ET on this day
                 market_open = self.eastern.localize(
                     datetime.combine(check_date, self.rth_open)
@@ -181,8 +190,7 @@ class MarketHoursChecker:
         date = dt_eastern.date()
         
         # Check today first
-        schedule = self.calendar.schedule(start_date=date, end_date=date)
-        if not schedule.empty:
+        if self.is_trading_day(date):
             market_close = self.eastern.localize(
                 datetime.combine(date, self.rth_close)
             )
@@ -192,9 +200,7 @@ class MarketHoursChecker:
         # Look ahead for next trading day
         for i in range(1, 10):
             check_date = date + timedelta(days=i)
-            schedule = self.calendar.schedule(start_date=check_date, end_date=check_date)
-            
-            if not schedule.empty:
+            if self.is_trading_day(check_date):
                 market_close = self.eastern.localize(
                     datetime.combine(check_date, self.rth_close)
                 )
@@ -19,6 +19,10 @@ class PerformanceTracker:
         """Initialize performance tracker."""
         self.db = db_manager
         self.alpaca = alpaca_client
+        
+        # (fill count, closed trades) from the last calculation
+        self._closed_trades_cache: Optional[Tuple[int, List[Dict]]] = None
+        
         logger.info("performance_tracker_initialized")
 
     # Account-level P&L from Alpaca
@@ -83,9 +87,18 @@ class PerformanceTracker:
         
         A closed trade is a buy followed by a sell (or vice versa).
         
+        Fills are append-only, so the result is cached and only recomputed
+        when the fill count changes. Treat the returned trade dicts as
+        read-only; they are shared between calls.
+        
         Returns:
             List of closed trade dicts with P&L
         """
+        fill_count = self.db.count_fills(session)
+        cached = self._closed_trades_cache
+        if cached is not None and cached[0] == fill_count:
+            return list(cached[1])
+        
         fills = session.query(FillRecord).order_by(FillRecord.ts).all()
         
         # Group fills by symbol
@@ -148,8 +161,9 @@ class PerformanceTracker:
             
             closed_trades.extend(trades)
         
+        self._closed_trades_cache = (fill_count, closed_trades)
         logger.info("closed_trades_calculated", num_trades=len(closed_trades))
-        return closed_trades
+        return list(closed_trades)
 
     def calculate_trade_statistics(self, session: Session) -> Dict:
         """
@@ -373,30 +387,62 @@ class PerformanceTracker:
         
         return "\n".join(lines)
 
-    def export_trades_to_csv(self, session: Session, filename: str = "trades.csv"):
+    def export_trades_to_csv(self, session: Session, filename: str = "trades.csv", fileobj=None) -> Dict:
         """
         Export closed trades to CSV file.
         
+        Summary figures are accumulated while the rows are written, so callers
+        don't need a second pass over the trades to report on the export.
+        
         Args:
             session: Database session
-            filename: Output filename
+            filename: Output filename (opened with a 1 MiB write buffer)
+            fileobj: Already-open text file to write to instead of filename,
+                e.g. a gzip or custom-buffered stream; left open
+            
+        Returns:
+            Dict with count, first_entry_ts, last_exit_ts and total_pnl
+            (count 0 and nothing written when there are no closed trades)
         """
         import csv
+        from contextlib import nullcontext
         
+        summary = {'count': 0, 'first_entry_ts': None, 'last_exit_ts': None, 'total_pnl': 0.0}
         closed_trades = self.calculate_closed_trades(session)
         
         if not closed_trades:
             logger.warning("no_trades_to_export")
-            return
+            return summary
         
-        with open(filename, 'w', newline='') as f:
+        def rows():
+            first_entry_ts = last_exit_ts = None
+            total_pnl = 0.0
+            for trade in closed_trades:
+                total_pnl += trade['pnl']
+                if first_entry_ts is None or trade['entry_ts'] < first_entry_ts:
+                    first_entry_ts = trade['entry_ts']
+                if last_exit_ts is None or trade['exit_ts'] > last_exit_ts:
+                    last_exit_ts = trade['exit_ts']
+                yield trade
+            summary.update(
+                count=len(closed_trades),
+                first_entry_ts=first_entry_ts,
+                last_exit_ts=last_exit_ts,
+                total_pnl=total_pnl,
+            )
+        
+        if fileobj is None:
+            output = open(filename, 'w', newline='', buffering=1 << 20)
+        else:
+            output = nullcontext(fileobj)
+        with output as f:
             writer = csv.DictWriter(f, fieldnames=[
                 'symbol', 'entry_ts', 'exit_ts', 'duration',
                 'entry_price', 'exit_price', 'qty',
                 'pnl', 'pnl_pct', 'trade_type'
             ])
             writer.writeheader()
-            writer.writerows(closed_trades)
+            writer.writerows(rows())
         
-        logger.info("trades_exported_to_csv", filename=filename, count=len(closed_trades))
-
+        logger.info("trades_exported_to_csv", filename=filename, count=summary['count'])
+        return summary
@@ -42,7 +42,7 @@ class SymbolStateMachine:
         
         logger.info("state_machine_initialized", symbol=self.symbol)
 
-    def get_status(self) -> SymbolStatus:
+    async def get_status(self) -> SymbolStatus:
         """
         Determine current status of the symbol.
         
@@ -57,35 +57,41 @@ class SymbolStateMachine:
                     return SymbolStatus.COOLDOWN
 
         # Check position
-        positions = self.alpaca.get_positions()
+        positions = await self.alpaca.fetch_positions()
         if self.symbol in positions and positions[self.symbol]["quantity"] > 0:
             return SymbolStatus.POSITION_OPEN
 
         # Check pending entry orders
-        open_orders = self.alpaca.get_open_orders()
+        open_orders = await self.alpaca.fetch_open_orders()
         for order_wrapper in open_orders:
             if (
                 order_wrapper.contract.symbol == self.symbol
                 and order_wrapper.order.side.value.upper() == "BUY"
-                and order_wrapper.orderStatus.status in ["accepted", "new", "pending_new", "partially_filled"]
+                and order_wrapper.orderStatus.status in {"accepted", "new", "pending_new", "partially_filled"}
             ):
                 return SymbolStatus.ENTRY_PENDING
 
         return SymbolStatus.NO_POSITION
 
-    async def process(self, current_positions: Dict[str, float], account_value: Optional[float]):
+    async def process(
+        self,
+        current_positions: Dict[str, float],
+        account_value: Optional[float],
+        last_price: Optional[float] = None,
+    ):
         """
         Process state machine logic for this symbol.
         
         Args:
             current_positions: Dict of symbol -> position value for exposure checking
             account_value: Total account value
+            last_price: Price already fetched for this tick (fetched here if None)
         """
-        status = self.get_status()
+        status = await self.get_status()
         logger.debug("processing_symbol", symbol=self.symbol, status=status.value)
 
         if status == SymbolStatus.NO_POSITION:
-            await self._handle_no_position(current_positions, account_value)
+            await self._handle_no_position(current_positions, account_value, last_price)
         elif status == SymbolStatus.ENTRY_PENDING:
             await self._handle_entry_pending()
         elif status == SymbolStatus.POSITION_OPEN:
@@ -94,7 +100,10 @@ class SymbolStateMachine:
             await self._handle_cooldown()
 
     async def _handle_no_position(
-        self, current_positions: Dict[str, float], account_value: Optional[float]
+        self,
+        current_positions: Dict[str, float],
+        account_value: Optional[float],
+        last_price: Optional[float] = None,
     ):
         """Handle NO_POSITION state - create entry order if conditions met."""
         # Check if we should re-arm
@@ -102,7 +111,8 @@ class SymbolStateMachine:
             state = self.db.get_symbol_state(session, self.symbol)
             
             # Get last price
-            last_price = await self.alpaca.get_last_price(self.symbol)
+            if not last_price:
+                last_price = await self.alpaca.get_last_price(self.symbol)
             if not last_price:
                 logger.warning("cannot_fetch_price", symbol=self.symbol)
                 return
@@ -165,7 +175,7 @@ class SymbolStateMachine:
 
     async def _handle_position_open(self):
         """Handle POSITION_OPEN state - ensure trailing stop exists and is healthy."""
-        positions = self.alpaca.get_positions()
+        positions = await self.alpaca.fetch_positions()
         position = positions.get(self.symbol)
         
         if not position:
@@ -175,7 +185,7 @@ class SymbolStateMachine:
         position_qty = int(position["quantity"])
         
         # Check for existing trailing stop
-        open_orders = self.alpaca.get_open_orders()
+        open_orders = await self.alpaca.fetch_open_orders()
         trailing_stops = [
             order_wrapper
             for order_wrapper in open_orders
@@ -295,12 +305,12 @@ class SymbolStateMachine:
 
     async def cancel_unfilled_entries(self):
         """Cancel unfilled entry orders (e.g., at end of day)."""
-        open_orders = self.alpaca.get_open_orders()
+        open_orders = await self.alpaca.fetch_open_orders()
         for order_wrapper in open_orders:
             if (
                 order_wrapper.contract.symbol == self.symbol
                 and order_wrapper.order.side.value.upper() == "BUY"
-                and order_wrapper.orderStatus.status in ["accepted", "new", "pending_new"]
+                and order_wrapper.orderStatus.status in {"accepted", "new", "pending_new"}
             ):
                 await self.alpaca.cancel_order(order_wrapper)
                 with self.db.get_session() as session:
@@ -1,6 +1,10 @@
 """Shared pytest fixtures."""
 
 import pytest
+from types import SimpleNamespace
+
+from alpaca.trading.enums import OrderSide, OrderType, OrderStatus as AlpacaOrderStatus
+
 from src.config import BotConfig
 from src.database import DatabaseManager
 
@@ -49,3 +53,17 @@ def test_db():
     yield db
     # Cleanup handled by in-memory DB
 
+
+def make_order(order_id="o1", status=AlpacaOrderStatus.NEW, filled_qty="0",
+               filled_avg_price=None, side=OrderSide.BUY, order_type=OrderType.STOP,
+               symbol="TSLA"):
+    """Build a stand-in for an alpaca-py Order."""
+    return SimpleNamespace(
+        id=order_id,
+        symbol=symbol,
+        status=status,
+        filled_qty=filled_qty,
+        filled_avg_price=filled_avg_price,
+        side=side,
+        type=order_type,
+    )
@@ -0,0 +1,276 @@
+"""Tests for the Alpaca client wrapper (no network; the SDK clients are mocked)."""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from alpaca.trading.enums import OrderStatus as AlpacaOrderStatus
+
+from src import alpaca_client
+from src.alpaca_client import (
+    AlpacaClient, AlpacaOrder, TRACKED_ORDERS_MAX, TRACKED_ORDERS_TTL_SECONDS, _TokenBucket,
+)
+from tests.conftest import make_order
+
+
+@pytest.fixture
+def client(test_config):
+    """Create a client whose TradingClient is a mock."""
+    client = AlpacaClient(test_config)
+    client.trading_client = Mock()
+    return client
+
+
+class FakeClock:
+    """Stand-in for the time module: sleep() advances monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(alpaca_client, "time", clock)
+    return clock
+
+
+def test_token_bucket_burst_then_waits(clock):
+    """Test that the bucket allows a burst, then waits for each refill."""
+    bucket = _TokenBucket(rate_per_second=2.0, burst=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_refills_up_to_burst(clock):
+    """Test that idle time refills tokens without exceeding the burst size."""
+    bucket = _TokenBucket(rate_per_second=2.0, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+
+    clock.now += 60
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert len(clock.sleeps) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_open_orders_tracks_and_caches(client):
+    """Test that open orders fetched off the loop are tracked and cached."""
+    client.trading_client.get_orders.return_value = [make_order("o1"), make_order("o2")]
+
+    orders = await client.fetch_open_orders()
+    assert [w.order.id for w in orders] == ["o1", "o2"]
+    assert set(client.tracked_orders) == {"o1", "o2"}
+
+    await client.fetch_open_orders()
+    assert client.trading_client.get_orders.call_count == 1
+
+
+@pytest.mark.parametrize("price, expected", [
+    (21.2 * 0.95, 20.13),     # 20.139999999999997
+    (229.6 * 0.95, 218.11),   # 218.11999999999998
+    (0.29, 0.29),             # 0.29 * 100 is 28.999999999999996
+    (250.0, 250.0),
+    (105.129, 105.12),
+    (0.123456, 0.1234),
+    (0.00001234567, 0.0000123),
+])
+def test_round_to_tick_floors_like_decimal(client, price, expected):
+    """Test that prices round down exactly as Decimal(str(price)) would."""
+    assert client.round_to_tick(price) == expected
+
+
+def test_round_to_tick_matches_decimal_for_computed_prices(client):
+    """Test last_price * (1 +/- pct) inputs against the Decimal reference."""
+    from decimal import Decimal, ROUND_DOWN
+
+    for cents in range(200, 100_000, 37):
+        last = cents / 100
+        for pct in (0.5, 1.0, 5.0, 10.0):
+            for price in (last * (1 + pct / 100), last * (1 - pct / 100)):
+                expected = float(
+                    (Decimal(str(price)) / Decimal("0.01")).quantize(1, ROUND_DOWN) * Decimal("0.01")
+                )
+                assert client.round_to_tick(price) == expected, price
+
+
+@pytest.mark.asyncio
+async def test_concurrent_price_lookups_share_one_fetch(client):
+    """Test that concurrent misses for a symbol wait on a single fetch."""
+    calls = []
+
+    async def fetch(symbols):
+        calls.append(list(symbols))
+        await asyncio.sleep(0.01)
+        return {symbol: 250.0 for symbol in symbols}
+
+    client._fetch_last_prices = fetch
+    prices = await asyncio.gather(*(client.get_last_price("TSLA") for _ in range(5)))
+
+    assert prices == [250.0] * 5
+    assert calls == [["TSLA"]]
+    assert client._price_inflight == {}
+
+    # Served from the cache afterwards
+    assert await client.get_last_price("TSLA") == 250.0
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_price_fetch_releases_waiters(client):
+    """Test that waiters on a failed fetch get None and the next lookup refetches."""
+    async def fail(symbols):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("quote request failed")
+
+    client._fetch_last_prices = fail
+    results = await asyncio.gather(
+        client.get_last_price("TSLA"), client.get_last_price("TSLA"), return_exceptions=True
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] is None
+    assert client._price_inflight == {}
+    assert "TSLA" not in client._price_cache
+
+
+def test_tracked_orders_bounded_and_dropped_when_terminal(client):
+    """Test that tracked_orders is bounded and forgets orders once they close."""
+    assert client.tracked_orders.maxsize == TRACKED_ORDERS_MAX
+    assert client.tracked_orders.ttl == TRACKED_ORDERS_TTL_SECONDS
+
+    statuses = []
+    client.register_order_status_callback(statuses.append)
+    client.tracked_orders["o1"] = AlpacaOrder(make_order("o1"))
+    client.tracked_orders["o2"] = AlpacaOrder(make_order("o2"))
+
+    client._handle_order_update(make_order("o1", status=AlpacaOrderStatus.CANCELED))
+
+    assert [w.orderStatus.status for w in statuses] == ["canceled"]
+    assert set(client.tracked_orders) == {"o2"}
+
+
+@pytest.mark.asyncio
+async def test_closed_orders_poll_skips_already_handled_states(client):
+    """Test that a repeated (status, filled_qty) isn't dispatched again."""
+    fills, statuses = [], []
+    client.register_fill_callback(lambda wrapper, fill: fills.append(fill))
+    client.register_order_status_callback(statuses.append)
+    filled = make_order("o1", status=AlpacaOrderStatus.FILLED, filled_qty="10", filled_avg_price="250.5")
+    client.trading_client.get_orders.return_value = [filled]
+
+    await client.check_for_events()
+    client.last_order_check = None  # Force the next poll
+    await client.check_for_events()
+
+    assert client.trading_client.get_orders.call_count == 2
+    assert len(statuses) == 1
+    assert [(f.execution.shares, f.execution.price, f.execution.execId) for f in fills] == [
+        (10.0, 250.5, "o1")
+    ]
+
+
+def test_order_update_dispatched_again_when_state_changes(client):
+    """Test that the dedup key is (status, filled_qty), not just the order id."""
+    statuses = []
+    client.register_order_status_callback(statuses.append)
+    client.tracked_orders["o1"] = AlpacaOrder(make_order("o1"))
+
+    partial = make_order("o1", status=AlpacaOrderStatus.PARTIALLY_FILLED, filled_qty="4")
+    client._handle_order_update(partial)
+    client._handle_order_update(partial)
+    client._handle_order_update(make_order("o1", status=AlpacaOrderStatus.CANCELED, filled_qty="4"))
+
+    assert [w.orderStatus.status for w in statuses] == ["partially_filled", "canceled"]
+    assert client._handled_states["o1"] == (AlpacaOrderStatus.CANCELED, "4")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_account_misses_share_one_fetch(client):
+    """Test that worker threads missing the account cache make one request."""
+    import time
+
+    calls = []
+
+    def get_account():
+        calls.append(1)
+        time.sleep(0.05)
+        return SimpleNamespace(equity="25000.5")
+
+    client.trading_client.get_account.side_effect = get_account
+    values = await asyncio.gather(*(asyncio.to_thread(client.get_account_value) for _ in range(6)))
+
+    assert values == [25000.5] * 6
+    assert len(calls) == 1
+
+    client.invalidate_account_caches()
+    assert client.get_account_value() == 25000.5
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_order_closed_by_stream_during_submit_isnt_tracked(client):
+    """Test that a terminal update arriving before submit returns doesn't leave a stale tracked order."""
+    import threading
+    from alpaca.trading.enums import OrderSide, OrderType
+
+    fills = []
+    client.register_fill_callback(lambda wrapper, fill: fills.append(fill))
+    submitted = make_order("o1", side=OrderSide.SELL, order_type=OrderType.TRAILING_STOP)
+    in_submit, release = threading.Event(), threading.Event()
+
+    def submit_order(order_request):
+        in_submit.set()
+        release.wait(1)
+        return submitted
+
+    client.trading_client.submit_order.side_effect = submit_order
+    placing = asyncio.create_task(client.place_trailing_stop("TSLA", 10, 100.0))
+    await asyncio.to_thread(in_submit.wait, 1)
+
+    filled = make_order("o1", status=AlpacaOrderStatus.FILLED, filled_qty="10", filled_avg_price="90.0",
+                        side=OrderSide.SELL, order_type=OrderType.TRAILING_STOP)
+    await client._on_trade_update(SimpleNamespace(event="fill", order=filled))
+    release.set()
+    wrapper = await placing
+
+    assert wrapper.order is submitted
+    assert len(fills) == 1
+    assert "o1" not in client.tracked_orders
+
+    # Orders still open when submit returns are tracked as before
+    client.trading_client.submit_order.side_effect = None
+    client.trading_client.submit_order.return_value = make_order("o2")
+    await client.place_trailing_stop("TSLA", 10, 100.0)
+    assert "o2" in client.tracked_orders
+
+
+def test_reset_paper_account_drops_cached_state(client):
+    """Test that positions and orders read before a reset aren't served after it."""
+    client._positions_cache = ({"TSLA": {"quantity": 10}}, alpaca_client.time.monotonic())
+    client._open_orders_cache = ([AlpacaOrder(make_order("o1"))], alpaca_client.time.monotonic())
+    client.trading_client.get_all_positions.return_value = []
+
+    assert client.reset_paper_account() is True
+    client.trading_client.close_all_positions.assert_called_once_with(cancel_orders=True)
+    assert client._positions_cache is None
+    assert client._open_orders_cache is None
+    assert client.get_positions() == {}
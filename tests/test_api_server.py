@@ -27,6 +27,8 @@ def api_client(api_db):
     import api_server
     api_server.db = api_db
     api_server.tracker = api_server.PerformanceTracker(api_db)
+    api_server.clear_cache()
+    api_server.check_database_health()
     
     api_server.app.config['TESTING'] = True
     with api_server.app.test_client() as client:
@@ -44,6 +46,29 @@ def test_health_endpoint(api_client):
     assert data['database'] == 'connected'
 
 
+def test_request_session_removed_after_request(api_client, api_db):
+    """Test that the request-scoped session is released on teardown."""
+    response = api_client.get('/events')
+    assert response.status_code == 200
+    assert not api_db.scoped_session.registry.has()
+
+
+def test_health_endpoint_reports_probe_failure(api_client, monkeypatch):
+    """Test /health reflects the last background probe result."""
+    import api_server
+    
+    broken_db = DatabaseManager("sqlite:///:memory:")  # No tables created
+    monkeypatch.setattr(api_server, 'db', broken_db)
+    api_server.check_database_health()
+    
+    response = api_client.get('/health')
+    assert response.status_code == 500
+    
+    data = json.loads(response.data)
+    assert data['status'] == 'unhealthy'
+    assert 'last_check' in data
+
+
 def test_index_endpoint(api_client):
     """Test / endpoint returns API documentation."""
     response = api_client.get('/')
@@ -102,6 +127,25 @@ def test_status_endpoint(api_client, api_db):
     assert data['last_event']['type'] == 'bot_started'
 
 
+def test_status_endpoint_is_cached(api_client, api_db):
+    """Test that /status is served from cache within the TTL."""
+    response = api_client.get('/status')
+    assert json.loads(response.data)['active_orders'] == 0
+    
+    with api_db.get_session() as session:
+        api_db.add_order(session, order_id="1", symbol="TSLA", side="BUY",
+                        order_type="STP", status="Submitted", qty=10)
+    
+    # Still within TTL - cached payload
+    response = api_client.get('/status')
+    assert json.loads(response.data)['active_orders'] == 0
+    
+    import api_server
+    api_server.clear_cache()
+    response = api_client.get('/status')
+    assert json.loads(response.data)['active_orders'] == 1
+
+
 def test_orders_endpoint_default(api_client, api_db):
     """Test /orders endpoint with default parameters (active only)."""
     with api_db.get_session() as session:
@@ -211,6 +255,27 @@ def test_orders_endpoint_limit_cap(api_client, api_db):
     assert data['count'] == 200  # Capped at 200
 
 
+def test_invalid_limit_returns_400(api_client):
+    """Test that non-integer limits are rejected instead of silently defaulted."""
+    response = api_client.get('/fills?limit=abc')
+    assert response.status_code == 400
+    assert 'error' in json.loads(response.data)
+    
+    response = api_client.get('/daily?days=1.5')
+    assert response.status_code == 400
+
+
+def test_non_positive_limit_is_clamped(api_client, api_db):
+    """Test that zero/negative limits can't be used to fetch the whole table."""
+    with api_db.get_session() as session:
+        for i in range(3):
+            api_db.add_event(session, "test_event", "TSLA", {"i": i})
+    
+    response = api_client.get('/events?limit=-1')
+    assert response.status_code == 200
+    assert json.loads(response.data)['count'] == 1
+
+
 def test_fills_endpoint(api_client, api_db):
     """Test /fills endpoint."""
     with api_db.get_session() as session:
@@ -234,6 +299,204 @@ def test_fills_endpoint(api_client, api_db):
     assert 'fills' in data
 
 
+def test_fills_buffer_picks_up_new_fills(api_client, api_db):
+    """Test buffered /fills stays ordered by timestamp as fills arrive."""
+    base = datetime(2024, 10, 31, 10, 0, 0)
+    
+    def add(exec_id, minutes):
+        with api_db.get_session() as session:
+            api_db.add_fill(session, exec_id=exec_id, symbol="TSLA", side="BUY",
+                            qty=1, price=250.0, order_id="1",
+                            ts=base + timedelta(minutes=minutes))
+    
+    add("a", 1)
+    add("b", 2)
+    response = api_client.get('/fills?limit=2')
+    assert [f['exec_id'] for f in json.loads(response.data)['fills']] == ["b", "a"]
+    
+    # A newer fill and a late-recorded older one
+    add("c", 3)
+    add("d", 0)
+    response = api_client.get('/fills?limit=3')
+    assert [f['exec_id'] for f in json.loads(response.data)['fills']] == ["c", "b", "a"]
+
+
+def test_fills_endpoint_empty(api_client):
+    """Test /fills streams a well-formed body when there are no fills."""
+    response = api_client.get('/fills')
+    assert response.status_code == 200
+    
+    data = json.loads(response.data)
+    assert data['count'] == 0
+    assert data['fills'] == []
+    assert 'timestamp' in data
+
+
+def test_fills_timestamps_are_iso8601(api_client, api_db):
+    """Test that record timestamps are serialized as ISO-8601 strings."""
+    with api_db.get_session() as session:
+        api_db.add_fill(
+            session,
+            exec_id="exec_iso",
+            symbol="TSLA",
+            side="BUY",
+            qty=10,
+            price=250.0,
+            order_id="1",
+            ts=datetime(2024, 10, 31, 14, 25, 30),
+        )
+    
+    response = api_client.get('/fills')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    
+    data = json.loads(response.data)
+    assert data['fills'][0] == {
+        'timestamp': '2024-10-31T14:25:30',
+        'symbol': 'TSLA',
+        'side': 'BUY',
+        'quantity': 10.0,
+        'price': 250.0,
+        'order_id': '1',
+        'exec_id': 'exec_iso',
+    }
+
+
+def test_fills_endpoint_serializer_error_mid_list(api_client, api_db, monkeypatch):
+    """Test that a failure while streaming still ends in valid JSON that reports it."""
+    import api_server
+    
+    with api_db.get_session() as session:
+        for i in range(3):
+            api_db.add_fill(session, exec_id=f"exec_{i}", symbol="TSLA", side="BUY",
+                            qty=10, price=250.0 + i, order_id=str(i))
+    
+    fill_record = api_server._fill_record
+    
+    def flaky_record(fill):
+        if fill.exec_id == "exec_0":
+            raise ValueError("bad row")
+        return fill_record(fill)
+    
+    monkeypatch.setattr(api_server, "_fill_record", flaky_record)
+    response = api_client.get('/fills')
+    assert response.status_code == 200
+    
+    data = json.loads(response.data)
+    assert data['count'] == 2
+    assert [f['exec_id'] for f in data['fills']] == ["exec_2", "exec_1"]
+    assert data['error'] == "bad row"
+
+
+def test_fills_endpoint_non_finite_price(api_client, api_db):
+    """Test that non-finite fill prices are encoded as null, keeping the JSON valid."""
+    import api_server
+    from types import SimpleNamespace
+    
+    with api_db.get_session() as session:
+        api_db.add_fill(session, exec_id="exec_inf", symbol="TSLA", side="BUY",
+                        qty=10, price=float("inf"), order_id="1")
+    
+    response = api_client.get('/fills')
+    assert response.status_code == 200
+    assert json.loads(response.data)['fills'][0]['price'] is None
+    
+    row = SimpleNamespace(ts=datetime(2024, 1, 2), symbol="TSLA", side="SELL", qty=5,
+                          price=float("nan"), order_id="2", exec_id="exec_nan")
+    assert json.loads(api_server._fill_record(row))['price'] is None
+
+
+def test_fills_endpoint_compressed(api_client, api_db):
+    """Test that large /fills responses are gzip-compressed on request."""
+    pytest.importorskip("flask_compress")
+    import gzip
+    
+    with api_db.get_session() as session:
+        for i in range(50):
+            api_db.add_fill(session, exec_id=f"exec_{i}", symbol="TSLA", side="BUY",
+                            qty=10, price=250.0 + i, order_id=str(i))
+    
+    response = api_client.get('/fills?limit=50', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    
+    data = json.loads(gzip.decompress(response.data))
+    assert data['count'] == 50
+
+
+@pytest.fixture
+def stream_client(api_client):
+    """Test client that doesn't keep request contexts around between streams."""
+    import api_server
+    return api_server.app.test_client()
+
+
+def test_stream_endpoint(stream_client, api_db, monkeypatch):
+    """Test /stream pushes status, performance and new fills."""
+    import api_server
+    monkeypatch.setattr(api_server, "STREAM_POLL_SECONDS", 0.01)
+    
+    response = stream_client.get('/stream', buffered=False)
+    try:
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        
+        chunks = response.iter_encoded()
+        assert next(chunks) == b'retry: 2000\n\n'
+        first = next(chunks)
+        assert b'event: status\n' in first
+        assert b'event: performance\n' in first
+        
+        with api_db.get_session() as session:
+            api_db.add_fill(session, exec_id="e1", symbol="TSLA", side="BUY",
+                            qty=10, price=250.0, order_id="1")
+        
+        pushed = next(chunks)
+        while b'event: fill\n' not in pushed:
+            pushed = next(chunks)
+        fill = json.loads(pushed.split(b'event: fill\ndata: ')[1].split(b'\n')[0])
+        assert fill['exec_id'] == "e1"
+        assert fill['price'] == 250.0
+    finally:
+        response.close()
+
+
+def test_stream_ends_after_max_duration(stream_client, monkeypatch):
+    """Test that /stream closes after STREAM_MAX_SECONDS so clients reconnect."""
+    import api_server
+    monkeypatch.setattr(api_server, "STREAM_MAX_SECONDS", 0.0)
+    
+    response = stream_client.get('/stream')
+    response.close()
+    assert response.status_code == 200
+    assert response.data == b'retry: 2000\n\n'
+    assert api_server._stream_slots.acquire(blocking=False)
+    api_server._stream_slots.release()
+
+
+def test_stream_subscriber_cap(stream_client):
+    """Test that /stream refuses subscribers past the cap until one closes."""
+    import api_server
+    
+    streams = [
+        stream_client.get('/stream', buffered=False)
+        for _ in range(api_server.STREAM_MAX_SUBSCRIBERS)
+    ]
+    try:
+        assert all(r.status_code == 200 for r in streams)
+        
+        refused = stream_client.get('/stream', buffered=False)
+        assert refused.status_code == 503
+        assert refused.headers['Retry-After'] == '30'
+        
+        streams.pop().close()
+        streams.append(stream_client.get('/stream', buffered=False))
+        assert streams[-1].status_code == 200
+    finally:
+        for r in reversed(streams):
+            r.close()
+
+
 def test_events_endpoint(api_client, api_db):
     """Test /events endpoint."""
     with api_db.get_session() as session:
@@ -258,6 +521,56 @@ def test_performance_endpoint_no_trades(api_client):
     assert 'message' in data or 'overall' in data
 
 
+def test_performance_endpoint_with_trades(api_client, api_db):
+    """Test /performance aggregates overall and per-symbol metrics."""
+    base = datetime(2024, 10, 31, 10, 0, 0)
+    fills = [
+        ("TSLA", "BUY", 100.0), ("TSLA", "SELL", 110.0),   # +100
+        ("NVDA", "BUY", 50.0), ("NVDA", "SELL", 45.0),     # -50
+        ("NVDA", "BUY", 40.0), ("NVDA", "SELL", 42.0),     # +20
+    ]
+    with api_db.get_session() as session:
+        for i, (symbol, side, price) in enumerate(fills):
+            api_db.add_fill(session, exec_id=f"exec_{i}", symbol=symbol, side=side,
+                            qty=10, price=price, order_id=str(i),
+                            ts=base + timedelta(minutes=i))
+    
+    response = api_client.get('/performance')
+    assert response.status_code == 200
+    
+    data = json.loads(response.data)
+    overall = data['overall']
+    assert overall['total_trades'] == 3
+    assert overall['winning_trades'] == 2
+    assert overall['losing_trades'] == 1
+    assert overall['total_pnl'] == 70.0
+    assert overall['gross_profit'] == 120.0
+    assert overall['gross_loss'] == 50.0
+    assert overall['profit_factor'] == 2.4
+    assert data['by_symbol']['NVDA'] == {'trades': 2, 'pnl': -30.0, 'wins': 1, 'losses': 1}
+
+
+def test_aggregate_trades():
+    """Test overall and per-symbol aggregation, keeping symbols in first-seen order."""
+    import api_server
+    
+    closed_trades = [
+        {'symbol': 'TSLA', 'pnl': 100.0},
+        {'symbol': 'NVDA', 'pnl': -50.0},
+        {'symbol': 'NVDA', 'pnl': 20.0},
+        {'symbol': 'AAPL', 'pnl': 0.0},
+    ]
+    
+    num_wins, num_losses, gross_profit, gross_loss, symbol_stats = (
+        api_server._aggregate_trades(closed_trades)
+    )
+    
+    assert (num_wins, num_losses, gross_profit, gross_loss) == (2, 1, 120.0, 50.0)
+    assert list(symbol_stats) == ['TSLA', 'NVDA', 'AAPL']
+    assert symbol_stats['NVDA'] == {'trades': 2, 'pnl': -30.0, 'wins': 1, 'losses': 1}
+    assert symbol_stats['AAPL'] == {'trades': 1, 'pnl': 0.0, 'wins': 0, 'losses': 1}
+
+
 def test_daily_endpoint(api_client, api_db):
     """Test /daily endpoint."""
     response = api_client.get('/daily?days=7')
@@ -269,6 +582,35 @@ def test_daily_endpoint(api_client, api_db):
     assert 'daily_pnl' in data
 
 
+def test_snapshot_endpoint(api_client, api_db):
+    """Test /snapshot combines the requested sections in one response."""
+    with api_db.get_session() as session:
+        api_db.add_order(session, order_id="1", symbol="TSLA", side="BUY",
+                        order_type="STP", status="Submitted", qty=10)
+        api_db.add_fill(session, exec_id="exec_1", symbol="TSLA", side="BUY",
+                        qty=10, price=250.0, order_id="1")
+    
+    response = api_client.get('/snapshot?include=status,orders,fills,perf,daily&days=7')
+    assert response.status_code == 200
+    
+    data = json.loads(response.data)
+    assert set(data) == {'timestamp', 'status', 'orders', 'fills', 'performance', 'daily'}
+    assert data['status']['active_orders'] == 1
+    assert data['orders']['count'] == 1
+    assert data['fills']['fills'][0]['exec_id'] == 'exec_1'
+    assert data['daily']['days'] == 7
+    
+    response = api_client.get('/snapshot')
+    assert set(json.loads(response.data)) == {'timestamp', 'status', 'performance'}
+
+
+def test_snapshot_unknown_section_returns_400(api_client):
+    """Test /snapshot rejects unknown section names."""
+    response = api_client.get('/snapshot?include=status,bogus')
+    assert response.status_code == 400
+    assert 'error' in json.loads(response.data)
+
+
 def test_reset_endpoint(api_client):
     """Test /reset endpoint returns instructions."""
     response = api_client.post('/reset')
@@ -0,0 +1,214 @@
+"""Tests for the bot's order callbacks and background work."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+from cachetools import LRUCache
+
+from alpaca.trading.enums import OrderType, OrderStatus as AlpacaOrderStatus
+
+from src.alpaca_client import AlpacaOrder
+from src.bot import TradingBot
+from src import bot as bot_module
+from src.database import EventRecord, FillRecord
+from tests.conftest import make_order
+
+
+@pytest.fixture
+def bot(test_config):
+    """Create a bot on an in-memory database with a mocked TradingClient."""
+    test_config.persistence.db_url = "sqlite:///:memory:"
+    bot = TradingBot(test_config)
+    bot.alpaca.trading_client = Mock()
+    return bot
+
+
+@pytest.mark.asyncio
+async def test_partial_then_full_fill_places_full_size_stop(bot):
+    """Test that a stream partial fill doesn't size the trailing stop."""
+    sm = bot.state_machines["TSLA"]
+    sm.place_trailing_stop_after_entry = AsyncMock()
+    bot.alpaca.tracked_orders["o1"] = AlpacaOrder(make_order())
+
+    bot.alpaca._handle_order_update(make_order(
+        status=AlpacaOrderStatus.PARTIALLY_FILLED, filled_qty="4", filled_avg_price="100.0"))
+    bot.alpaca._handle_order_update(make_order(
+        status=AlpacaOrderStatus.PARTIALLY_FILLED, filled_qty="7", filled_avg_price="100.5"))
+    bot.alpaca._handle_order_update(make_order(
+        status=AlpacaOrderStatus.FILLED, filled_qty="10", filled_avg_price="101.0"))
+    await asyncio.gather(*bot._background_tasks)
+
+    sm.place_trailing_stop_after_entry.assert_awaited_once_with(10, 101.0)
+    with bot.db.get_session() as session:
+        fills = session.query(FillRecord).all()
+        assert [(f.qty, f.price) for f in fills] == [(10, 101.0)]
+    assert "o1" not in bot.alpaca.tracked_orders
+
+
+@pytest.mark.asyncio
+async def test_periodic_keeps_running_after_errors(bot):
+    """Test that a periodic task survives failures and stops with the bot."""
+    calls = []
+
+    async def check():
+        calls.append(asyncio.get_running_loop().time())
+        if len(calls) == 1:
+            raise RuntimeError("poll failed")
+
+    bot.running = True
+    task = asyncio.create_task(bot._periodic("order_events", 0.01, check))
+    await asyncio.sleep(0.055)
+    bot.running = False
+    await asyncio.wait_for(task, 1)
+
+    assert 3 <= len(calls) <= 7
+    assert all(b - a >= 0.009 for a, b in zip(calls, calls[1:]))
+
+
+@pytest.mark.asyncio
+async def test_run_loop_runs_periodic_tasks_alongside_trading(bot, test_config):
+    """Test that event checks and keep-alives run on their own cadences and stop with the loop."""
+    test_config.polling.event_check_seconds = 0.01
+    test_config.polling.keepalive_seconds = 0.01
+    bot.alpaca.check_for_events = AsyncMock()
+    bot.alpaca.keep_alive = AsyncMock()
+
+    async def trading_loop():
+        await asyncio.sleep(0.05)
+        bot.running = False
+
+    bot._trading_loop = trading_loop
+    bot.running = True
+    await bot._run_loop()
+    checks = bot.alpaca.check_for_events.await_count
+
+    assert checks >= 3
+    assert bot.alpaca.keep_alive.await_count >= 3
+    await asyncio.sleep(0.03)
+    assert bot.alpaca.check_for_events.await_count == checks
+
+
+@pytest.mark.asyncio
+async def test_event_writer_batches_until_sentinel(bot, monkeypatch):
+    """Test that queued events are written in bounded batches and flushed on the sentinel."""
+    monkeypatch.setattr(bot_module, "EVENT_BATCH_MAX", 3)
+    batches = []
+    write_events = bot._write_events
+    bot._write_events = lambda events: (batches.append(len(events)), write_events(events))
+
+    bot._event_writer_task = asyncio.create_task(bot._event_writer())
+    for i in range(7):
+        bot._record_event("order_status", "TSLA", {"n": i})
+    await bot._event_queue.put(None)
+    await asyncio.wait_for(bot._event_writer_task, 1)
+
+    assert batches == [3, 3, 1]
+    with bot.db.get_session() as session:
+        payloads = [e.payload_json["n"] for e in session.query(EventRecord).order_by(EventRecord.id)]
+    assert payloads == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_record_event_writes_directly_without_writer(bot):
+    """Test that events recorded while no writer runs aren't lost."""
+    bot._record_event("order_status", "TSLA", {"n": 1})
+
+    assert bot._event_queue.empty()
+    with bot.db.get_session() as session:
+        assert session.query(EventRecord).filter(EventRecord.event_type == "order_status").count() == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_queued_events_before_bot_stopped(bot):
+    """Test that _run_loop's cleanup writes queued events before stop() records bot_stopped."""
+    bot.alpaca.connect = AsyncMock()
+    bot.alpaca.disconnect = AsyncMock()
+    bot.alpaca.check_for_events = AsyncMock()
+    bot.alpaca.keep_alive = AsyncMock()
+
+    async def trading_loop():
+        for i in range(5):
+            bot._record_event("fill", "TSLA", {"n": i})
+        assert not bot._event_queue.empty()
+        bot.running = False
+
+    bot._trading_loop = trading_loop
+    await bot.start()
+
+    with bot.db.get_session() as session:
+        events = [e.event_type for e in session.query(EventRecord).order_by(EventRecord.id)]
+    assert events == ["bot_started"] + ["fill"] * 5 + ["bot_stopped"]
+
+
+def filled_entry(order_id, qty="10", price="250.0", order_type=OrderType.STOP):
+    """A filled BUY order wrapper and its fill, as passed to the fill callback."""
+    order = make_order(order_id, status=AlpacaOrderStatus.FILLED, filled_qty=qty,
+                       filled_avg_price=price, order_type=order_type)
+    return AlpacaOrder(order), bot_module.AlpacaClient._order_fill(order)
+
+
+@pytest.mark.asyncio
+async def test_repeat_fill_skipped_via_seen_exec_ids(bot, monkeypatch):
+    """Test that repeat fill callbacks are skipped without a DB lookup, and past the LRU via the DB."""
+    bot.state_machines["TSLA"].place_trailing_stop_after_entry = AsyncMock()
+    bot._seen_exec_ids = LRUCache(maxsize=2)
+    fill_exists = Mock(wraps=bot.db.fill_exists)
+    monkeypatch.setattr(bot.db, "fill_exists", fill_exists)
+
+    for order_id in ("o1", "o1", "o2", "o3", "o1"):
+        bot._on_fill(*filled_entry(order_id))
+    await asyncio.gather(*bot._background_tasks)
+
+    # New fills are checked by _on_fill and again by add_fill. o1's repeat is
+    # answered by the LRU; once o2/o3 evict it, by the fills table.
+    assert [c.args[1] for c in fill_exists.call_args_list] == ["o1", "o1", "o2", "o2", "o3", "o3", "o1"]
+    assert bot.state_machines["TSLA"].place_trailing_stop_after_entry.await_count == 3
+    with bot.db.get_session() as session:
+        assert session.query(FillRecord).count() == 3
+    assert "o1" in bot._seen_exec_ids
+
+
+@pytest.mark.asyncio
+async def test_stop_awaits_background_placements(bot):
+    """Test that stop() lets spawned order placements finish before disconnecting."""
+    order = []
+
+    async def place_stop():
+        await asyncio.sleep(0.02)
+        order.append("placed")
+
+    async def failing():
+        raise RuntimeError("order rejected")
+
+    bot.alpaca.disconnect = AsyncMock(side_effect=lambda: order.append("disconnected"))
+    done = bot._spawn(place_stop())
+    failed = bot._spawn(failing())
+    assert bot._background_tasks == {done, failed}
+
+    await bot.stop()
+
+    assert order == ["placed", "disconnected"]
+    assert bot._background_tasks == set()
+    assert isinstance(failed.exception(), RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_sigterm_wakes_closed_market_sleep_and_stops(bot):
+    """Test that SIGTERM is handled on the loop and ends the bot without waiting out its sleep."""
+    import os
+    import signal
+
+    bot.alpaca.connect = AsyncMock()
+    bot.alpaca.disconnect = AsyncMock()
+    bot.alpaca.check_for_events = AsyncMock()
+    bot.alpaca.keep_alive = AsyncMock()
+    bot.market_hours.is_regular_trading_hours = Mock(return_value=False)
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.05, os.kill, os.getpid(), signal.SIGTERM)
+    await asyncio.wait_for(bot.start(), 2)  # The market-closed branch sleeps 60s
+
+    assert bot.running is False
+    bot.alpaca.disconnect.assert_awaited_once()
+    # Handlers are removed again once the bot has stopped
+    assert loop.remove_signal_handler(signal.SIGTERM) is False
@@ -21,6 +21,34 @@ def test_create_tables(db):
     assert db.SessionLocal is not None
 
 
+def test_file_database_uses_pooled_wal_engine(tmp_path):
+    """Test that file-backed SQLite uses a connection pool with WAL enabled."""
+    from sqlalchemy import text
+    from sqlalchemy.pool import QueuePool
+    
+    file_db = DatabaseManager(f"sqlite:///{tmp_path / 'bot.db'}")
+    file_db.create_tables()
+    
+    assert isinstance(file_db.engine.pool, QueuePool)
+    with file_db.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+
+
+def test_create_tables_adds_composite_indexes(db):
+    """Test that the composite lookup indexes exist."""
+    from sqlalchemy import inspect
+    
+    inspector = inspect(db.engine)
+    event_indexes = {ix['name']: ix['column_names'] for ix in inspector.get_indexes('events')}
+    order_indexes = {ix['name']: ix['column_names'] for ix in inspector.get_indexes('orders')}
+    
+    assert event_indexes['ix_events_type_ts'] == ['event_type', 'ts']
+    assert order_indexes['ix_orders_status_created'] == ['status', 'created_at']
+    
+    # Re-running against an existing database is a no-op
+    db.create_tables()
+
+
 def test_upsert_symbol_state(db):
     """Test inserting and updating symbol state."""
     with db.get_session() as session:
@@ -116,6 +144,45 @@ def test_add_fill(db):
         assert fill.price == 252.50
 
 
+def test_count_fills(db):
+    """Test counting fill records, ignoring duplicate exec_ids."""
+    with db.get_session() as session:
+        assert db.count_fills(session) == 0
+        
+        for exec_id in ["e1", "e2", "e2", "e3"]:
+            db.add_fill(session, exec_id=exec_id, symbol="TSLA", side="BUY",
+                        qty=1, price=250.0, order_id="1")
+        
+        assert db.count_fills(session) == 3
+
+
+def test_get_status_summary(db):
+    """Test the combined status counters query."""
+    with db.get_session() as session:
+        summary = db.get_status_summary(session)
+        assert summary['active_orders'] == 0
+        assert summary['total_fills'] == 0
+        assert summary['last_event_type'] is None
+        assert summary['bot_started_ts'] is None
+        
+        db.add_order(session, order_id="1", symbol="TSLA", side="BUY",
+                     order_type="STP", status="Submitted", qty=10)
+        db.add_order(session, order_id="2", symbol="TSLA", side="BUY",
+                     order_type="STP", status="Filled", qty=10)
+        db.add_fill(session, exec_id="e1", symbol="TSLA", side="BUY",
+                    qty=10, price=250.0, order_id="2")
+        db.add_event(session, "bot_started")
+        db.add_event(session, "fill", "TSLA", {"exec_id": "e1"})
+        
+        summary = db.get_status_summary(session)
+        assert summary['active_orders'] == 1
+        assert summary['total_fills'] == 1
+        assert summary['last_event_type'] == "fill"
+        assert summary['last_event_symbol'] == "TSLA"
+        assert isinstance(summary['last_event_ts'], datetime)
+        assert isinstance(summary['bot_started_ts'], datetime)
+
+
 def test_add_event(db):
     """Test adding event records."""
     with db.get_session() as session:
@@ -132,6 +199,27 @@ def test_add_event(db):
         assert event.payload_json["order_id"] == 1001
 
 
+def test_add_events(db):
+    """Test bulk-adding event records."""
+    with db.get_session() as session:
+        assert db.add_events(session, []) == 0
+        
+        stamped = datetime(2024, 1, 2, 3, 4, 5)
+        written = db.add_events(session, [
+            {"event_type": "fill", "symbol": "tsla", "payload": {"exec_id": "e1"}, "ts": stamped},
+            {"event_type": "order_canceled"},
+        ])
+        assert written == 2
+        
+        events = session.query(EventRecord).order_by(EventRecord.id).all()
+        assert [e.event_type for e in events] == ["fill", "order_canceled"]
+        assert events[0].symbol == "TSLA"
+        assert events[0].payload_json == {"exec_id": "e1"}
+        assert events[0].ts == stamped
+        assert events[1].symbol is None
+        assert isinstance(events[1].ts, datetime)
+
+
 def test_get_recent_fills(db):
     """Test retrieving recent fills."""
     with db.get_session() as session:
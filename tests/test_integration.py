@@ -22,8 +22,8 @@ class TestGapUpScenario:
         """
         # Setup mocks
         mock_alpaca = Mock()
-        mock_alpaca.get_positions = Mock(return_value={})
-        mock_alpaca.get_open_orders = Mock(return_value=[])
+        mock_alpaca.fetch_positions = AsyncMock(return_value={})
+        mock_alpaca.fetch_open_orders = AsyncMock(return_value=[])
         mock_alpaca.get_last_price = AsyncMock(return_value=100.0)
         
         # Mock successful entry with trailing stop
@@ -50,7 +50,7 @@ class TestGapUpScenario:
         sm = SymbolStateMachine("TSLA", test_config, mock_alpaca, test_db, sizer)
         
         # Initial state: no position
-        status = sm.get_status()
+        status = await sm.get_status()
         assert status == SymbolStatus.NO_POSITION
         
         # Process - should create entry
@@ -58,7 +58,7 @@ class TestGapUpScenario:
         mock_alpaca.place_entry_with_trailing_stop.assert_called_once()
         
         # Simulate entry fill - position now exists
-        mock_alpaca.get_positions.return_value = {
+        mock_alpaca.fetch_positions.return_value = {
             "TSLA": {"quantity": 10, "avg_cost": 105.0, "market_value": 1050}
         }
         
@@ -72,7 +72,7 @@ class TestGapUpScenario:
         mock_stop.order.totalQuantity = 10
         mock_stop.order.qty = 10.0
         mock_stop.order.id = 2001
-        mock_alpaca.get_open_orders.return_value = [mock_stop]
+        mock_alpaca.fetch_open_orders.return_value = [mock_stop]
         # Mock place_trailing_stop in case it's needed
         mock_alpaca.place_trailing_stop = AsyncMock(return_value=mock_stop)
         
@@ -80,7 +80,7 @@ class TestGapUpScenario:
         await sm.process({}, 50000)
         
         # Status should be POSITION_OPEN
-        status = sm.get_status()
+        status = await sm.get_status()
         assert status == SymbolStatus.POSITION_OPEN
 
 
@@ -95,8 +95,8 @@ class TestTrailingStopScenario:
         Expected: Cooldown period starts, no new entries for N minutes.
         """
         mock_alpaca = Mock()
-        mock_alpaca.get_positions = Mock(return_value={})
-        mock_alpaca.get_open_orders = Mock(return_value=[])
+        mock_alpaca.fetch_positions = AsyncMock(return_value={})
+        mock_alpaca.fetch_open_orders = AsyncMock(return_value=[])
         mock_alpaca.get_last_price = AsyncMock(return_value=100.0)
         mock_alpaca.place_entry_with_trailing_stop = AsyncMock(return_value=(None, None))
         
@@ -107,7 +107,7 @@ class TestTrailingStopScenario:
         sm.on_stop_out()
         
         # Status should be COOLDOWN
-        status = sm.get_status()
+        status = await sm.get_status()
         assert status == SymbolStatus.COOLDOWN
         
         # Try to process - should not place order
@@ -132,8 +132,8 @@ class TestCooldownScenario:
         Expected: No entry during cooldown, entry allowed after expiration.
         """
         mock_alpaca = Mock()
-        mock_alpaca.get_positions = Mock(return_value={})
-        mock_alpaca.get_open_orders = Mock(return_value=[])
+        mock_alpaca.fetch_positions = AsyncMock(return_value={})
+        mock_alpaca.fetch_open_orders = AsyncMock(return_value=[])
         mock_alpaca.get_last_price = AsyncMock(return_value=100.0)
         
         mock_parent = Mock()
@@ -193,7 +193,7 @@ class TestDuplicateStopScenario:
         Expected: Keeps one, cancels duplicates.
         """
         mock_alpaca = Mock()
-        mock_alpaca.get_positions = Mock(return_value={
+        mock_alpaca.fetch_positions = AsyncMock(return_value={
             "TSLA": {"quantity": 10, "avg_cost": 250.0, "market_value": 2500}
         })
         mock_alpaca.get_last_price = AsyncMock(return_value=100.0)
@@ -230,7 +230,7 @@ class TestDuplicateStopScenario:
         mock_stop3.order.qty = 10.0
         mock_stop3.order.id = 2003
         
-        mock_alpaca.get_open_orders = Mock(return_value=[mock_stop1, mock_stop2, mock_stop3])
+        mock_alpaca.fetch_open_orders = AsyncMock(return_value=[mock_stop1, mock_stop2, mock_stop3])
         
         # Mock place_trailing_stop to return AsyncMock properly
         mock_trailing_stop = Mock()
@@ -286,7 +286,7 @@ class TestEODCancellation:
         mock_entry.orderStatus.status = "accepted"  # Use valid status
         mock_entry.order.id = 1001
         
-        mock_alpaca.get_open_orders = Mock(return_value=[mock_entry])
+        mock_alpaca.fetch_open_orders = AsyncMock(return_value=[mock_entry])
         
         sizer = PositionSizer(test_config)
         sm = SymbolStateMachine("TSLA", test_config, mock_alpaca, test_db, sizer)
@@ -317,8 +317,8 @@ class TestPositionSizingIntegration:
         Expected: New positions rejected or sized down.
         """
         mock_alpaca = Mock()
-        mock_alpaca.get_positions = Mock(return_value={})
-        mock_alpaca.get_open_orders = Mock(return_value=[])
+        mock_alpaca.fetch_positions = AsyncMock(return_value={})
+        mock_alpaca.fetch_open_orders = AsyncMock(return_value=[])
         mock_alpaca.get_last_price = AsyncMock(return_value=100.0)
         mock_alpaca.place_entry_with_trailing_stop = AsyncMock(return_value=(None, None))
         
@@ -106,3 +106,17 @@ def test_next_market_close():
     next_close_et = next_close.astimezone(eastern)
     assert next_close_et.time() == time(16, 0)
 
+
+def test_is_trading_day_memoized():
+    """Test trading-day lookups and that each date hits the calendar once."""
+    from datetime import date
+    from unittest.mock import patch
+    
+    checker = MarketHoursChecker("XNYS")
+    
+    assert checker.is_trading_day(date(2024, 1, 3)) is True   # Wednesday
+    assert checker.is_trading_day(date(2024, 1, 6)) is False  # Saturday
+    
+    with patch.object(checker.calendar, "schedule") as schedule:
+        assert checker.is_trading_day(date(2024, 1, 3)) is True
+        schedule.assert_not_called()
@@ -65,6 +65,30 @@ def test_calculate_closed_trades_single_round_trip(tracker, db):
         assert trades[0]['trade_type'] == 'long'
 
 
+def test_calculate_closed_trades_cached_until_new_fill(tracker, db, mocker):
+    """Test closed trades are reused until a new fill is recorded."""
+    with db.get_session() as session:
+        db.add_fill(session, exec_id="1", symbol="TSLA", side="BUY",
+                    qty=10, price=250.0, order_id="1001")
+        db.add_fill(session, exec_id="2", symbol="TSLA", side="SELL",
+                    qty=10, price=275.0, order_id="1002")
+        
+        first = tracker.calculate_closed_trades(session)
+        query_spy = mocker.spy(session, 'query')
+        second = tracker.calculate_closed_trades(session)
+        
+        assert second == first
+        assert second is not first
+        query_spy.assert_not_called()
+        
+        db.add_fill(session, exec_id="3", symbol="TSLA", side="BUY",
+                    qty=5, price=260.0, order_id="1003")
+        db.add_fill(session, exec_id="4", symbol="TSLA", side="SELL",
+                    qty=5, price=270.0, order_id="1004")
+        
+        assert len(tracker.calculate_closed_trades(session)) == 2
+
+
 def test_calculate_closed_trades_multiple_symbols(tracker, db):
     """Test trades across multiple symbols."""
     with db.get_session() as session:
@@ -235,10 +259,13 @@ def test_export_trades_to_csv(tracker, db, tmp_path):
         
         # Export
         csv_file = tmp_path / "test_trades.csv"
-        tracker.export_trades_to_csv(session, str(csv_file))
+        summary = tracker.export_trades_to_csv(session, str(csv_file))
         
         # Verify file exists and has content
         assert csv_file.exists()
+        assert summary['count'] == 1
+        assert summary['total_pnl'] == 250.0
+        assert summary['first_entry_ts'] <= summary['last_exit_ts']
         
         with open(csv_file, 'r') as f:
             reader = csv.DictReader(f)
@@ -249,6 +276,24 @@ def test_export_trades_to_csv(tracker, db, tmp_path):
             assert float(rows[0]['pnl']) == 250.0
 
 
+def test_export_trades_to_csv_fileobj(tracker, db):
+    """Test CSV export into a caller-provided file object."""
+    import csv
+    import io
+    
+    with db.get_session() as session:
+        db.add_fill(session, exec_id="1", symbol="TSLA", side="BUY", qty=10, price=250.0, order_id=1)
+        db.add_fill(session, exec_id="2", symbol="TSLA", side="SELL", qty=10, price=275.0, order_id=2)
+        
+        output = io.StringIO()
+        summary = tracker.export_trades_to_csv(session, "unused.csv", fileobj=output)
+    
+    assert not output.closed
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert len(rows) == summary['count'] == 1
+    assert float(rows[0]['pnl']) == 250.0
+
+
 def test_performance_snapshot(db):
     """Test performance snapshot storage."""
     with db.get_session() as session:
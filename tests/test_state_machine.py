@@ -32,8 +32,8 @@ def db_manager():
 def mock_alpaca_client():
     """Create mock Alpaca client."""
     client = Mock()
-    client.get_positions = Mock(return_value={})
-    client.get_open_orders = Mock(return_value=[])
+    client.fetch_positions = AsyncMock(return_value={})
+    client.fetch_open_orders = AsyncMock(return_value=[])
     client.get_last_price = AsyncMock(return_value=100.0)
     client.place_entry_with_trailing_stop = AsyncMock(return_value=(None, None))
     client.place_trailing_stop = AsyncMock(return_value=None)
@@ -67,26 +67,29 @@ def test_state_machine_initialization(state_machine):
     assert state_machine.config is not None
 
 
-def test_get_status_no_position(state_machine, mock_alpaca_client):
+@pytest.mark.asyncio
+async def test_get_status_no_position(state_machine, mock_alpaca_client):
     """Test status detection when no position exists."""
-    mock_alpaca_client.get_positions.return_value = {}
-    mock_alpaca_client.get_open_orders.return_value = []
+    mock_alpaca_client.fetch_positions.return_value = {}
+    mock_alpaca_client.fetch_open_orders.return_value = []
     
-    status = state_machine.get_status()
+    status = await state_machine.get_status()
     assert status == SymbolStatus.NO_POSITION
 
 
-def test_get_status_position_open(state_machine, mock_alpaca_client):
+@pytest.mark.asyncio
+async def test_get_status_position_open(state_machine, mock_alpaca_client):
     """Test status detection when position is open."""
-    mock_alpaca_client.get_positions.return_value = {
+    mock_alpaca_client.fetch_positions.return_value = {
         "TSLA": {"quantity": 10, "avg_cost": 250.0, "market_value": 2500}
     }
     
-    status = state_machine.get_status()
+    status = await state_machine.get_status()
     assert status == SymbolStatus.POSITION_OPEN
 
 
-def test_get_status_entry_pending(state_machine, mock_alpaca_client, db_manager):
+@pytest.mark.asyncio
+async def test_get_status_entry_pending(state_machine, mock_alpaca_client, db_manager):
     """Test status detection when entry order is pending."""
     mock_order = Mock()
     mock_order.contract.symbol = "TSLA"
@@ -95,14 +98,15 @@ def test_get_status_entry_pending(state_machine, mock_alpaca_client, db_manager)
     mock_order.orderStatus.status = "accepted"  # Use valid status
     mock_order.order.id = 1001
     
-    mock_alpaca_client.get_positions.return_value = {}
-    mock_alpaca_client.get_open_orders.return_value = [mock_order]
+    mock_alpaca_client.fetch_positions.return_value = {}
+    mock_alpaca_client.fetch_open_orders.return_value = [mock_order]
     
-    status = state_machine.get_status()
+    status = await state_machine.get_status()
     assert status == SymbolStatus.ENTRY_PENDING
 
 
-def test_get_status_cooldown(state_machine, db_manager):
+@pytest.mark.asyncio
+async def test_get_status_cooldown(state_machine, db_manager):
     """Test status detection when in cooldown."""
     # Set cooldown until future time
     future_time = datetime.utcnow() + timedelta(minutes=10)
@@ -113,11 +117,12 @@ def test_get_status_cooldown(state_machine, db_manager):
             cooldown_until_ts=future_time,
         )
     
-    status = state_machine.get_status()
+    status = await state_machine.get_status()
     assert status == SymbolStatus.COOLDOWN
 
 
-def test_get_status_cooldown_expired(state_machine, db_manager, mock_alpaca_client):
+@pytest.mark.asyncio
+async def test_get_status_cooldown_expired(state_machine, db_manager, mock_alpaca_client):
     """Test status when cooldown has expired."""
     # Set cooldown to past time
     past_time = datetime.utcnow() - timedelta(minutes=10)
@@ -128,10 +133,10 @@ def test_get_status_cooldown_expired(state_machine, db_manager, mock_alpaca_clie
             cooldown_until_ts=past_time,
         )
     
-    mock_alpaca_client.get_positions.return_value = {}
-    mock_alpaca_client.get_open_orders.return_value = []
+    mock_alpaca_client.fetch_positions.return_value = {}
+    mock_alpaca_client.fetch_open_orders.return_value = []
     
-    status = state_machine.get_status()
+    status = await state_machine.get_status()
     assert status == SymbolStatus.NO_POSITION  # Cooldown expired
 
 
@@ -174,10 +179,10 @@ async def test_handle_no_position_places_order(state_machine, mock_alpaca_client
 async def test_handle_position_open_missing_stop(state_machine, mock_alpaca_client):
     """Test that missing trailing stop is recreated."""
     # Position exists but no trailing stop
-    mock_alpaca_client.get_positions.return_value = {
+    mock_alpaca_client.fetch_positions.return_value = {
         "TSLA": {"quantity": 10, "avg_cost": 250.0, "market_value": 2500}
     }
-    mock_alpaca_client.get_open_orders.return_value = []
+    mock_alpaca_client.fetch_open_orders.return_value = []
     
     mock_trade = Mock()
     mock_trade.order.id = 2001  # Use .id
@@ -194,7 +199,7 @@ async def test_handle_position_open_missing_stop(state_machine, mock_alpaca_clie
 async def test_handle_position_open_duplicate_stops(state_machine, mock_alpaca_client):
     """Test that duplicate trailing stops are cancelled."""
     # Position with multiple trailing stops
-    mock_alpaca_client.get_positions.return_value = {
+    mock_alpaca_client.fetch_positions.return_value = {
         "TSLA": {"quantity": 10, "avg_cost": 250.0, "market_value": 2500}
     }
     
@@ -218,7 +223,7 @@ async def test_handle_position_open_duplicate_stops(state_machine, mock_alpaca_c
     mock_stop2.order.qty = 10.0
     mock_stop2.order.id = 2002
     
-    mock_alpaca_client.get_open_orders.return_value = [mock_stop1, mock_stop2]
+    mock_alpaca_client.fetch_open_orders.return_value = [mock_stop1, mock_stop2]
     # Use AsyncMock for async cancel
     mock_alpaca_client.cancel_order = AsyncMock()
     
@@ -232,7 +237,7 @@ async def test_handle_position_open_duplicate_stops(state_machine, mock_alpaca_c
 async def test_handle_position_open_qty_mismatch(state_machine, mock_alpaca_client):
     """Test that stop with wrong quantity is replaced."""
     # Position with 10 shares but stop for 5 shares
-    mock_alpaca_client.get_positions.return_value = {
+    mock_alpaca_client.fetch_positions.return_value = {
         "TSLA": {"quantity": 10, "avg_cost": 250.0, "market_value": 2500}
     }
     
@@ -246,7 +251,7 @@ async def test_handle_position_open_qty_mismatch(state_machine, mock_alpaca_clie
     mock_stop.order.qty = 5.0
     mock_stop.order.id = 3000
     
-    mock_alpaca_client.get_open_orders.return_value = [mock_stop]
+    mock_alpaca_client.fetch_open_orders.return_value = [mock_stop]
     
     mock_new_trade = Mock()
     mock_new_trade.order.id = 3001  # Use .id
@@ -288,7 +293,7 @@ async def test_cancel_unfilled_entries(state_machine, mock_alpaca_client):
     mock_entry.orderStatus.status = "accepted"  # Use valid status for cancellation
     mock_entry.order.id = 1001
     
-    mock_alpaca_client.get_open_orders.return_value = [mock_entry]
+    mock_alpaca_client.fetch_open_orders.return_value = [mock_entry]
     # Use AsyncMock for async cancel
     mock_alpaca_client.cancel_order = AsyncMock()
     